@@ -1,8 +1,11 @@
+import os
 from contextlib import asynccontextmanager
+from functools import partial
 from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.routes import events, performances, athletes, base
+from api.json_response import FastJSONResponse
+from api.routes import events, performances, athletes, base, compare, records
 from api.loader import load_events
 
 
@@ -11,10 +14,20 @@ async def lifespan(app: FastAPI):
     """Application lifespan context: pre-load events at startup.
 
     Uses anyio.to_thread.run_sync to run the blocking loader without
-    blocking the event loop.
+    blocking the event loop. Set LOAD_WORKERS > 1 to parse event files in a
+    process pool, and MAX_HYDRATED_EVENTS to only keep that many events' laps
+    in memory (hydrated on demand).
     """
+    workers = int(os.environ.get("LOAD_WORKERS", "0"))
+    max_hydrated = os.environ.get("MAX_HYDRATED_EVENTS")
     try:
-        ok = await to_thread.run_sync(load_events)
+        ok = await to_thread.run_sync(
+            partial(
+                load_events,
+                workers=workers,
+                max_hydrated=int(max_hydrated) if max_hydrated else None,
+            )
+        )
         print(f"Startup: events loaded -> {ok}")
     except Exception as e:
         print(f"Startup: failed to load events: {e}")
@@ -26,6 +39,7 @@ app = FastAPI(
     description="API for skateboard race event tracking and analysis",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Enable CORS for frontend integration
@@ -42,3 +56,5 @@ app.include_router(base.router)
 app.include_router(events.router)
 app.include_router(performances.router)
 app.include_router(athletes.router)
+app.include_router(compare.router)
+app.include_router(records.router)
@@ -0,0 +1,38 @@
+"""JSON responses using orjson when it is installed, the stdlib otherwise"""
+
+import json
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # Optional dependency: fall back to the stdlib encoder
+    orjson = None
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode content to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with ``encode_json``."""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+class EncodedJSONResponse(Response):
+    """Response for a body that is already encoded JSON bytes."""
+
+    media_type = "application/json"
@@ -1,29 +1,151 @@
+import hashlib
+import json
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from api.response_cache import ResponseCache
+from event_stats import EventStats
 from file_manager import FileManager
+from leaderboard import Leaderboard
 from models.event import Event
 from models.event_registry import EventRegistry
+from models.event_snapshot import EventSnapshot
 from models.athlete_registry import AthleteRegistry
 
+# Erreurs levées par la lecture d'un snapshot corrompu ou tronqué
+SNAPSHOT_ERRORS = (OSError, ValueError, IndexError, struct.error, BufferError)
+
+
+def compile_event_file(json_file: str, use_snapshot: bool = True) -> bytes:
+    """Retourne le snapshot binaire d'un fichier d'événement.
+
+    Le snapshot existant est relu s'il est à jour (et ``use_snapshot`` vrai),
+    sinon le JSON est parsé et le snapshot est (re)compilé à côté pour les
+    démarrages suivants. Ne touche à aucun registre : peut tourner dans un
+    processus séparé.
+    """
+    snapshot_file = EventSnapshot.path_for(json_file)
+    if use_snapshot and EventSnapshot.is_fresh(snapshot_file, json_file):
+        try:
+            with open(snapshot_file, "rb") as f:
+                return f.read()
+        except OSError as e:
+            print(f"[WARN] Ignoring snapshot {snapshot_file}: {e}")
+
+    with open(json_file, "rb") as f:
+        raw = f.read()
+    source_hash = hashlib.blake2b(raw, digest_size=16).digest()
+    snapshot = EventSnapshot.pack(json.loads(raw), source_hash)
+
+    try:
+        EventSnapshot.write(snapshot_file, snapshot)
+    except OSError as e:
+        print(f"[WARN] Could not write snapshot {snapshot_file}: {e}")
+    return snapshot
+
+
+def _event_from_snapshot(json_file: str, snapshot: bytes, laps: bool) -> Event:
+    """Reconstruit l'événement depuis un snapshot compilé.
+
+    Les tours ne sont laissés de côté que si le snapshot est bien sur disque,
+    pour pouvoir les réhydrater plus tard.
+    """
+    snapshot_file = EventSnapshot.path_for(json_file)
+    on_disk = EventSnapshot.is_fresh(snapshot_file, json_file)
+    event = EventSnapshot.unpack(snapshot, laps=laps or not on_disk)
+    if on_disk:
+        event.file_path = snapshot_file
+    return event
+
+
+def _event_from_compiled(json_file: str, snapshot: bytes, laps: bool) -> Event:
+    """Reconstruit l'événement d'un snapshot compilé par ``compile_event_file``.
+
+    Un snapshot relu du disque peut être corrompu ou tronqué : l'événement
+    est alors recompilé depuis le JSON, comme dans ``load_event_file``.
+    """
+    try:
+        return _event_from_snapshot(json_file, snapshot, laps)
+    except SNAPSHOT_ERRORS as e:
+        print(f"[WARN] Ignoring snapshot {EventSnapshot.path_for(json_file)}: {e}")
+    snapshot = compile_event_file(json_file, use_snapshot=False)
+    return _event_from_snapshot(json_file, snapshot, laps)
+
+
+def load_event_file(json_file: str, laps: bool = True) -> Event:
+    """Charge un événement, depuis son snapshot binaire s'il est à jour.
+
+    Le snapshot à jour est lu via mmap ; sinon il est d'abord compilé depuis
+    le JSON (voir ``compile_event_file``). Avec ``laps=False`` seul l'en-tête
+    de chaque performance est chargé, les tours sont hydratés à la demande.
+    """
+    snapshot_file = EventSnapshot.path_for(json_file)
+    if EventSnapshot.is_fresh(snapshot_file, json_file):
+        try:
+            return EventSnapshot.read(snapshot_file, laps=laps)
+        except SNAPSHOT_ERRORS as e:
+            # Snapshot corrompu ou tronqué : recompilé depuis le JSON
+            print(f"[WARN] Ignoring snapshot {snapshot_file}: {e}")
+    snapshot = compile_event_file(json_file, use_snapshot=False)
+    return _event_from_snapshot(json_file, snapshot, laps)
+
+
+def _load_events_parallel(json_files: list[str], workers: int, laps: bool) -> None:
+    """Compile les fichiers dans un pool de processus puis les enregistre.
 
-def load_events() -> bool:
+    Le parsing (coûteux) est fait dans les workers ; l'enregistrement des
+    athlètes reste dans le processus parent, dans l'ordre des fichiers, pour
+    que le registre soit identique à un chargement séquentiel.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(compile_event_file, file) for file in json_files]
+        for file, future in zip(json_files, futures):
+            try:
+                event = _event_from_compiled(file, future.result(), laps)
+                EventRegistry.add_event(event)
+                print(f"[OK] Loaded: {event.name} {event.date.year}")
+            except Exception as e:
+                print(f"[ERROR] Loading {file}: {e}")
+
+
+def load_events(workers: int = 0, max_hydrated: int | None = None) -> bool:
     """Charge tous les événements depuis les fichiers JSON et les enregistre.
 
+    Args:
+        workers (int): Nombre de processus pour parser les fichiers en
+            parallèle. 0 ou 1 charge les fichiers séquentiellement.
+        max_hydrated (int | None): Si défini, les événements sont chargés sans
+            leurs tours, hydratés à la demande, et au plus ``max_hydrated``
+            événements gardent leurs tours en mémoire (LRU).
+
     Returns:
         bool: True si au moins un événement a été chargé.
     """
-    json_files = FileManager.get_all_json_in_dir("scraped_events_save")
+    json_files = sorted(FileManager.get_all_json_in_dir("scraped_events_save"))
 
     if not json_files:
         print("[WARN] No event files found in 'scraped_events_save/'")
         return False
 
-    for file in json_files:
-        try:
-            event = Event.from_json_file(file)
-            EventRegistry.add_event(event)
-            EventRegistry.sort_all_performances()
-            print(f"[OK] Loaded: {event.name} {event.date.year}")
-        except Exception as e:
-            print(f"[ERROR] Loading {file}: {e}")
+    laps = max_hydrated is None
+    EventRegistry.max_hydrated = max_hydrated
+
+    if workers > 1 and len(json_files) > 1:
+        _load_events_parallel(json_files, workers, laps)
+    else:
+        for file in json_files:
+            try:
+                event = load_event_file(file, laps=laps)
+                EventRegistry.add_event(event)
+                print(f"[OK] Loaded: {event.name} {event.date.year}")
+            except Exception as e:
+                print(f"[ERROR] Loading {file}: {e}")
+
+    EventRegistry.sort_all_performances()
+    for event in EventRegistry.events:
+        EventStats.of(event)
+        Leaderboard.add_event(event)
+    ResponseCache.clear()
 
     print(
         f"[OK] {EventRegistry.count()} events loaded, "
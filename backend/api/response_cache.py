@@ -0,0 +1,95 @@
+"""Cache of encoded JSON responses for the immutable, loaded event data"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable
+
+from fastapi import Request, Response
+
+from api.json_response import EncodedJSONResponse, encode_json
+
+
+class ResponseCache:
+    """
+    Keeps pre-encoded JSON bodies keyed by route + params, each with a strong
+    ETag derived from the hashes of the files the data was loaded from.
+    Requests whose ``If-None-Match`` matches are answered with a 304.
+    """
+
+    # Upper bound on the total size of cached bodies (least recently used evicted)
+    max_bytes: int = 64 * 1024 * 1024
+    _entries: OrderedDict[str, bytes] = OrderedDict()
+    _size: int = 0
+
+    @classmethod
+    def respond(
+        cls,
+        request: Request,
+        key: str,
+        source_hashes: list[str],
+        build: Callable[[], Any],
+    ) -> Response:
+        """
+        Return the cached response for ``key``, building and caching it if needed.
+
+        Args:
+            request (Request): Incoming request (for If-None-Match)
+            key (str): Cache key, unique per route and normalized params
+            source_hashes (list[str]): Hashes of the source files of the data
+            build (Callable[[], Any]): Builds the JSON-serializable content on a miss
+        Returns:
+            Response: 304 if the client copy is current, else the JSON body
+        """
+        # The ETag only depends on the key and the sources: a current client
+        # copy is answered before any body is built (even after an eviction)
+        etag = cls.etag(key, source_hashes)
+        headers = {"Cache-Control": "no-cache"}
+        if etag:
+            headers["ETag"] = etag
+            if cls.matches(request, etag):
+                if key in cls._entries:
+                    cls._entries.move_to_end(key)
+                return Response(status_code=304, headers=headers)
+
+        body = cls._entries.get(key)
+        if body is None:
+            body = cls._store(key, encode_json(build()))
+        else:
+            cls._entries.move_to_end(key)
+        return EncodedJSONResponse(content=body, headers=headers)
+
+    @classmethod
+    def etag(cls, key: str, source_hashes: list[str]) -> str:
+        """Strong ETag for a key, or "" when some data has no known source."""
+        if not source_hashes or not all(source_hashes):
+            return ""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16)
+        for source_hash in source_hashes:
+            digest.update(source_hash.encode("ascii"))
+        return f'"{digest.hexdigest()}"'
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries.clear()
+        cls._size = 0
+
+    @classmethod
+    def _store(cls, key: str, body: bytes) -> bytes:
+        cls._entries[key] = body
+        cls._size += len(body)
+        while cls._size > cls.max_bytes and len(cls._entries) > 1:
+            _, evicted_body = cls._entries.popitem(last=False)
+            cls._size -= len(evicted_body)
+        return body
+
+    @classmethod
+    def matches(cls, request: Request, etag: str) -> bool:
+        """Whether the ``If-None-Match`` of a request (weak or list of tags) matches ``etag``."""
+        if_none_match = request.headers.get("if-none-match")
+        if not etag or not if_none_match:
+            return False
+        candidates = {
+            candidate.strip().removeprefix("W/")
+            for candidate in if_none_match.split(",")
+        }
+        return "*" in candidates or etag in candidates
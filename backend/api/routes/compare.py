@@ -0,0 +1,91 @@
+"""Routes comparing the editions of an event across years"""
+
+from fastapi import APIRouter, Query, Request
+from api.response_cache import ResponseCache
+from event_comparer import EventComparer
+from models.athlete import Athlete
+from models.event_registry import EventRegistry
+
+router = APIRouter(prefix="/compare", tags=["compare"])
+
+
+@router.get("/{name}/participation")
+async def get_participation(request: Request, name: str):
+    """Get the participants of each year, overall and per sport"""
+    events = EventRegistry.get_by_name(name)
+    if not events:
+        return {"error": f"No events found for name '{name}'"}
+    return ResponseCache.respond(
+        request,
+        key=f"compare:participation:{name.lower()}",
+        source_hashes=[event.source_hash for event in events],
+        build=lambda: EventComparer.of(events).participation(),
+    )
+
+
+@router.get("/{name}/histograms")
+async def get_histograms(
+    request: Request,
+    name: str,
+    bin_miles: float = Query(default=25, ge=1, le=1000),
+    sport: str | None = None,
+):
+    """Get the distance distribution of each year (of one sport, or of every sport)"""
+    events = EventRegistry.get_by_name(name)
+    if not events:
+        return {"error": f"No events found for name '{name}'"}
+    sport = sport.lower() if sport else None
+
+    def build():
+        comparer = EventComparer.of(events)
+        if sport:
+            return comparer.histograms(bin_miles, sport)
+        return comparer.sport_histograms(bin_miles)
+
+    return ResponseCache.respond(
+        request,
+        key=f"compare:histograms:{name.lower()}:{bin_miles}:{sport}",
+        source_hashes=[event.source_hash for event in events],
+        build=build,
+    )
+
+
+@router.get("/{name}/percentiles")
+async def get_percentiles(
+    request: Request,
+    name: str,
+    percent: list[float] = Query(default=[10, 25, 50]),
+    sport: str | None = None,
+):
+    """Get the miles needed to be in the top ``percent`` % of each year (repeatable)"""
+    events = EventRegistry.get_by_name(name)
+    if not events:
+        return {"error": f"No events found for name '{name}'"}
+    percent = sorted({value for value in percent if 0 < value <= 100})
+    if not percent:
+        return {"error": "Percentages must be in ]0, 100]"}
+    sport = sport.lower() if sport else None
+    return ResponseCache.respond(
+        request,
+        key=f"compare:percentiles:{name.lower()}:{percent}:{sport}",
+        source_hashes=[event.source_hash for event in events],
+        build=lambda: EventComparer.of(events).percentiles(percent, sport),
+    )
+
+
+@router.get("/{name}/athletes/{athlete_name}")
+async def get_athlete_deltas(request: Request, name: str, athlete_name: str):
+    """Get an athlete's result of each year, with the change from their previous one"""
+    events = EventRegistry.get_by_name(name)
+    if not events:
+        return {"error": f"No events found for name '{name}'"}
+    canonical_name = Athlete(name=athlete_name).canonical_name
+    deltas = EventComparer.of(events).athlete_deltas(canonical_name)
+    if not deltas:
+        return {"error": f"Athlete '{athlete_name}' not found"}
+    return ResponseCache.respond(
+        request,
+        key=f"compare:athlete:{name.lower()}:{canonical_name}",
+        source_hashes=[event.source_hash for event in events],
+        build=lambda: deltas,
+    )
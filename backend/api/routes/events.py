@@ -1,12 +1,68 @@
 """Routes for event endpoints"""
 
-from fastapi import APIRouter
+from typing import Iterable, Literal
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from api.json_response import encode_json
+from api.response_cache import ResponseCache
+from event_export import EventExport
+from event_stats import EventStats, PerformanceSummary
+from lap_analytics import LapAnalytics
+from milestone_splits import MilestoneSplits
+from models.athlete import Athlete
+from models.event import Event
 from models.event_registry import EventRegistry
-from event_stats import EventStats
+from race_timeline import RaceTimeline
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
+class GraphQuery:
+    """Query parameters selecting and shaping the graph series of an event"""
+
+    def __init__(
+        self,
+        max_points: int | None = Query(default=None, ge=3),
+        athlete: list[str] | None = Query(default=None),
+        sport: str | None = None,
+        category: str | None = None,
+        rank_from: int = Query(default=1, ge=1),
+        rank_to: int | None = Query(default=None, ge=1),
+    ):
+        self.max_points = max_points
+        self.athletes = (
+            sorted({Athlete(name=name).canonical_name for name in athlete if name})
+            if athlete
+            else None
+        )
+        self.sport = sport.lower() if sport else None
+        self.category = category.lower() if category else None
+        self.rank_from = rank_from
+        self.rank_to = rank_to
+
+    def cache_key(self, event: Event) -> str:
+        return (
+            f"graph:{event.slug}:{self.max_points}:{self.athletes}:"
+            f"{self.sport}:{self.category}:{self.rank_from}:{self.rank_to}"
+        )
+
+    def rows(self, event: Event) -> list[PerformanceSummary]:
+        return EventStats.of(event).select_rows(
+            athletes=self.athletes,
+            sport=self.sport,
+            category=self.category,
+            rank_from=self.rank_from,
+            rank_to=self.rank_to,
+        )
+
+    def graph_dict(self, row: PerformanceSummary) -> dict:
+        return {
+            "rank": row.rank,
+            **row.performance.to_graph_dict(max_points=self.max_points),
+        }
+
+
 @router.get("/")
 async def get_all_events():
     """Get all events (metadata only, no performances)"""
@@ -15,25 +71,249 @@ async def get_all_events():
 
 
 @router.get("/{name}/{year}")
-async def get_event_by_name_year(name: str, year: int):
+async def get_event_by_name_year(request: Request, name: str, year: int):
     """Get event by name and year"""
     event = EventRegistry.get_by_name_year(name, year)
     if event is None:
         return {"error": f"Event not found for name '{name}', year {year}"}
-    return event.to_dict(laps=False)
+    return ResponseCache.respond(
+        request,
+        key=f"event:{event.slug}",
+        source_hashes=[event.source_hash],
+        build=lambda: event.to_dict(laps=False),
+    )
 
 
 @router.get("/{name}/{year}/graph")
-async def get_event_graph_data(name: str, year: int):
-    """Get ECharts-ready graph data for an event (cumulative miles over time)"""
+async def get_event_graph_data(
+    request: Request, name: str, year: int, query: GraphQuery = Depends()
+):
+    """Get ECharts-ready graph data for an event (cumulative miles over time)
+
+    Performances are in rank order and can be selected by athlete (canonical
+    name, repeatable), sport, category and rank range. With ``max_points``,
+    each athlete series is downsampled (LTTB) to at most that many points,
+    e.g. the pixel width of the chart.
+    """
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+    return ResponseCache.respond(
+        request,
+        key=query.cache_key(event),
+        source_hashes=[event.source_hash],
+        build=lambda: {
+            "performances": [query.graph_dict(row) for row in query.rows(event)]
+        },
+    )
+
+
+@router.get("/{name}/{year}/graph/stream")
+async def stream_event_graph_data(
+    request: Request, name: str, year: int, query: GraphQuery = Depends()
+):
+    """Stream the graph data of an event as NDJSON, one performance per line
+
+    Same selection parameters as ``/graph``; lines come in rank order so the
+    leaders can be rendered first.
+    """
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+
+    etag = ResponseCache.etag(f"stream:{query.cache_key(event)}", [event.source_hash])
+    headers = {"Cache-Control": "no-cache"}
+    if etag:
+        headers["ETag"] = etag
+        if ResponseCache.matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+    rows = query.rows(event)
+
+    def lines():
+        for row in rows:
+            yield encode_json(query.graph_dict(row)) + b"\n"
+
+    return StreamingResponse(
+        lines(), media_type="application/x-ndjson", headers=headers
+    )
+
+
+@router.get("/{name}/{year}/analytics")
+async def get_event_analytics(
+    request: Request,
+    name: str,
+    year: int,
+    stretch_laps: int = Query(default=10, ge=1),
+):
+    """Get lap analytics of every performance of an event, as columns in rank order
+
+    Median lap, fastest and slowest ``stretch_laps``-lap stretches, fatigue
+    slope (seconds per lap gained each hour, pit stops excluded), pit stop
+    laps and the distance covered during each hour.
+    """
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+    return ResponseCache.respond(
+        request,
+        key=f"analytics:{event.slug}:{stretch_laps}",
+        source_hashes=[event.source_hash],
+        build=lambda: LapAnalytics.of(event).summary(stretch_laps),
+    )
+
+
+@router.get("/{name}/{year}/analytics/rolling")
+async def get_event_rolling_speed(
+    request: Request, name: str, year: int, window: int = Query(default=10, ge=1)
+):
+    """Get the rolling average speed (mph over ``window`` laps) of every performance"""
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+    return ResponseCache.respond(
+        request,
+        key=f"rolling:{event.slug}:{window}",
+        source_hashes=[event.source_hash],
+        build=lambda: LapAnalytics.of(event).rolling_speed(window),
+    )
+
+
+@router.get("/{name}/{year}/standings")
+async def get_event_standings(
+    name: str, year: int, time_ss: int | None = Query(default=None, ge=0)
+):
+    """Get the standings of an event at an elapsed time (default: the finish)
+
+    Not response-cached: each time is answered from the event timeline in
+    logarithmic time, so a slider can query any second of the race.
+    """
     event = EventRegistry.get_by_name_year(name, year)
     if event is None:
         return {"error": f"Event not found for name '{name}', year {year}"}
+    timeline = RaceTimeline.of(event)
+    if time_ss is None:
+        time_ss = timeline.duration_ss
+    leader = timeline.leader_at(time_ss)
     return {
-        "performances": [
-            perf.to_graph_dict() for perf in event.performances
-        ]
+        "time_ss": time_ss,
+        "duration_ss": timeline.duration_ss,
+        "leader": leader.performance.athlete.name if leader else None,
+        "standings": timeline.standings(time_ss),
+    }
+
+
+@router.get("/{name}/{year}/standings/lead-changes")
+async def get_event_lead_changes(request: Request, name: str, year: int):
+    """Get every change of leader during an event, in time order"""
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+    return ResponseCache.respond(
+        request,
+        key=f"lead-changes:{event.slug}",
+        source_hashes=[event.source_hash],
+        build=lambda: {"lead_changes": RaceTimeline.of(event).lead_changes()},
+    )
+
+
+@router.get("/{name}/{year}/standings/athlete/{athlete_name}")
+async def get_athlete_rank_history(
+    request: Request, name: str, year: int, athlete_name: str
+):
+    """Get the position of an athlete at the end of each of their laps"""
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+    timeline = RaceTimeline.of(event)
+    canonical_name = Athlete(name=athlete_name).canonical_name
+    index = timeline.index_of(canonical_name)
+    if index is None:
+        return {"error": f"Athlete '{athlete_name}' not found in {event.slug}"}
+    return ResponseCache.respond(
+        request,
+        key=f"rank-history:{event.slug}:{canonical_name}",
+        source_hashes=[event.source_hash],
+        build=lambda: timeline.rank_history(index),
+    )
+
+
+@router.get("/{name}/{year}/splits")
+async def get_event_splits(
+    request: Request,
+    name: str,
+    year: int,
+    miles: list[float] | None = Query(default=None),
+):
+    """Get the time at which every performance reached each milestone distance
+
+    ``miles`` is repeatable (default: 50, 100 and 200). Times are columns in
+    rank order, None where the distance was not reached.
+    """
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+    milestones = list(MilestoneSplits.milestones(miles)) if miles else None
+    if miles and not milestones:
+        return {
+            "error": f"Milestone distances must be in ]0, {MilestoneSplits.max_miles:g}] miles"
+        }
+
+    def build():
+        # Only the default milestones are kept in the (per event) splits cache
+        if milestones is None:
+            return MilestoneSplits.of(event).to_dict()
+        return MilestoneSplits(event, milestones).to_dict()
+
+    return ResponseCache.respond(
+        request,
+        key=f"splits:{event.slug}:{milestones}",
+        source_hashes=[event.source_hash],
+        build=build,
+    )
+
+
+def _export_response(
+    request: Request, events: Iterable[Event], granularity: str, file_name: str
+) -> StreamingResponse:
+    """Stream an NDJSON export, gzipped on the fly if the client accepts it."""
+    chunks = EventExport.ndjson(events, granularity)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{file_name}.ndjson"',
+        "Vary": "Accept-Encoding",
     }
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        chunks = EventExport.gzipped(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        chunks, media_type="application/x-ndjson", headers=headers
+    )
+
+
+@router.get("/export")
+async def export_all_events(
+    request: Request, granularity: Literal["performance", "lap"] = "performance"
+):
+    """Stream the lap data of every event as NDJSON (one line per performance or lap)"""
+    return _export_response(
+        request, list(EventRegistry.events), granularity, f"events_{granularity}s"
+    )
+
+
+@router.get("/{name}/{year}/export")
+async def export_event(
+    request: Request,
+    name: str,
+    year: int,
+    granularity: Literal["performance", "lap"] = "performance",
+):
+    """Stream the lap data of an event as NDJSON (one line per performance or lap)"""
+    event = EventRegistry.get_by_name_year(name, year)
+    if event is None:
+        return {"error": f"Event not found for name '{name}', year {year}"}
+    return _export_response(
+        request, [event], granularity, f"{event.slug}_{granularity}s"
+    )
 
 
 @router.get("/by-name/{name}")
@@ -48,8 +328,7 @@ async def get_events_by_name(name: str):
 @router.get("/{year}")
 async def get_event_by_year(year: int):
     """Get event by year"""
-    for event in EventRegistry.events:
-        if event.date.year == year:
-            event_stats = EventStats(event)
-            return event.to_dict(laps=False)
-    return {"error": f"Event for year {year} not found"}
+    events = EventRegistry.get_by_year(year)
+    if not events:
+        return {"error": f"Event for year {year} not found"}
+    return events[0].to_dict(laps=False)
@@ -0,0 +1,89 @@
+"""Routes for the all-time records and leaderboards"""
+
+from fastapi import APIRouter, Query, Request
+from api.response_cache import ResponseCache
+from leaderboard import Leaderboard
+from models.event_registry import EventRegistry
+
+router = APIRouter(prefix="/records", tags=["records"])
+
+
+def _source_hashes() -> list[str]:
+    return [event.source_hash for event in EventRegistry.events]
+
+
+@router.get("/")
+async def get_records(request: Request):
+    """Get the individual distance and split record holders, overall and per sport"""
+    return ResponseCache.respond(
+        request,
+        key="records",
+        source_hashes=_source_hashes(),
+        build=Leaderboard.records,
+    )
+
+
+@router.get("/distance")
+async def get_distance_leaderboard(
+    request: Request,
+    k: int = Query(default=10, ge=1, le=1000),
+    sport: str | None = None,
+    gender: str | None = None,
+    age_group: str | None = None,
+    unique_athletes: bool = True,
+    teams: bool = False,
+):
+    """Get the most miles in one event, all-time
+
+    Filters are exact (case-insensitive); with ``unique_athletes`` only the
+    best performance of each athlete is listed. Team performances are ranked
+    separately, with ``teams``.
+    """
+    key = Leaderboard.board_key(sport, gender, age_group, teams)
+    return ResponseCache.respond(
+        request,
+        key=f"records:distance:{key}:{k}:{unique_athletes}",
+        source_hashes=_source_hashes(),
+        build=lambda: Leaderboard.top_distance(
+            k, sport, gender, age_group, unique_athletes, teams
+        ),
+    )
+
+
+@router.get("/splits/{miles}")
+async def get_split_leaderboard(
+    request: Request,
+    miles: int,
+    k: int = Query(default=10, ge=1, le=1000),
+    sport: str | None = None,
+    gender: str | None = None,
+    age_group: str | None = None,
+    unique_athletes: bool = True,
+    teams: bool = False,
+):
+    """Get the fastest times to reach a milestone distance (e.g. 100 miles), all-time"""
+    if miles not in Leaderboard.split_miles:
+        return {
+            "error": f"No split leaderboard for {miles} miles "
+            f"(available: {[f"{m:g}" for m in Leaderboard.split_miles]})"
+        }
+    key = Leaderboard.board_key(sport, gender, age_group, teams)
+    return ResponseCache.respond(
+        request,
+        key=f"records:splits:{miles}:{key}:{k}:{unique_athletes}",
+        source_hashes=_source_hashes(),
+        build=lambda: Leaderboard.top_split(
+            miles, k, sport, gender, age_group, unique_athletes, teams
+        ),
+    )
+
+
+@router.get("/most-events")
+async def get_most_events(request: Request, k: int = Query(default=10, ge=1, le=1000)):
+    """Get the individual athletes who completed the most events"""
+    return ResponseCache.respond(
+        request,
+        key=f"records:most-events:{k}",
+        source_hashes=_source_hashes(),
+        build=lambda: Leaderboard.most_events(k),
+    )
@@ -1,6 +1,185 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections import Counter
+
 from event_stats import EventStats
+from models.event import Event
+
+
+class EventColumns:
+    """
+    Columns of the summary rows of one event, in rank order (most miles first),
+    precomputed once so that comparisons never walk the performances again.
+    """
+
+    def __init__(self, stats: EventStats) -> None:
+        event = stats.event
+        self.event: Event = event
+        self.year: int = event.date.year
+        self.count: int = len(stats.rows)
+        self.athletes: list[str] = [
+            row.performance.athlete.canonical_name for row in stats.rows
+        ]
+        self.names: list[str] = [row.performance.athlete.name for row in stats.rows]
+        self.sports: list[str] = [row.sport for row in stats.rows]
+        self.categories: list[str] = [row.performance.category for row in stats.rows]
+        self.age_groups: list[str] = [row.performance.age_group for row in stats.rows]
+        self.miles: array = array("d", (row.total_miles for row in stats.rows))
+
+    def sport_miles(self, sport: str | None) -> list[float]:
+        """Miles of the performances of a sport (case-insensitive substring), descending."""
+        if not sport:
+            return self.miles.tolist()
+        sport = sport.lower()
+        return [
+            miles
+            for miles, row_sport in zip(self.miles, self.sports)
+            if sport in row_sport.lower()
+        ]
 
 
 class EventComparer:
-    def __init(self, events: list[EventStats]):
-        self.events = events
+    """
+    Cross-year comparison of events: participation, distance distributions,
+    percentile thresholds and athlete year-to-year deltas.
+    """
+
+    _cache: dict[tuple[str, ...], EventComparer] = {}
+
+    def __init__(self, events: list[EventStats]):
+        self.events: list[EventStats] = sorted(events, key=lambda stats: stats.event.date)
+        self.columns: list[EventColumns] = [EventColumns(stats) for stats in self.events]
+
+    @classmethod
+    def of(cls, events: list[Event]) -> EventComparer:
+        """Return the cached comparer of events, rebuilt if performances were added."""
+        key = tuple(sorted(event.slug for event in events))
+        comparer = cls._cache.get(key)
+        if comparer is None or any(
+            columns.count != len(columns.event.performances)
+            for columns in comparer.columns
+        ):
+            comparer = cls._cache[key] = cls([EventStats.of(event) for event in events])
+        return comparer
+
+    def distinct(self, column: str) -> list[str]:
+        """Distinct values of a column ("sports", "categories", "age_groups") across events."""
+        return sorted({value for columns in self.columns for value in getattr(columns, column)})
+
+    def participation(self) -> list[dict]:
+        """
+        Participants of each event, overall and per sport, with the change
+        from the previous event.
+        """
+        result = []
+        previous: EventColumns | None = None
+        for columns in self.columns:
+            by_sport = Counter(columns.sports)
+            result.append(
+                {
+                    "year": columns.year,
+                    "participants": columns.count,
+                    "change": columns.count - previous.count if previous else None,
+                    "returning": (
+                        len(set(columns.athletes) & set(previous.athletes))
+                        if previous
+                        else None
+                    ),
+                    "by_sport": dict(sorted(by_sport.items())),
+                }
+            )
+            previous = columns
+        return result
+
+    def histograms(self, bin_miles: float = 25, sport: str | None = None) -> dict:
+        """
+        Distance distribution of each event, on bins shared by all events.
+
+        Args:
+            bin_miles (float): Width of a bin in miles
+            sport (str | None): Keep only this sport (case-insensitive substring)
+        Returns:
+            dict: Lower bound of each bin, and the count per bin of each year
+                (a list of ``{"year", "counts"}`` entries, in date order)
+        """
+        miles_by_year = {
+            columns.year: columns.sport_miles(sport) for columns in self.columns
+        }
+        longest = max((miles[0] for miles in miles_by_year.values() if miles), default=0)
+        bin_count = int(longest // bin_miles) + 1
+        years = []
+        for year, miles in miles_by_year.items():
+            counts = [0] * bin_count
+            for value in miles:
+                counts[int(value // bin_miles)] += 1
+            years.append({"year": year, "counts": counts})
+        return {
+            "sport": sport,
+            "bin_miles": bin_miles,
+            "bins": [round(index * bin_miles, 2) for index in range(bin_count)],
+            "years": years,
+        }
+
+    def sport_histograms(self, bin_miles: float = 25) -> dict[str, dict]:
+        """Distance histograms of every sport."""
+        return {
+            sport: self.histograms(bin_miles, sport) for sport in self.distinct("sports")
+        }
+
+    def percentiles(
+        self, percents: list[float], sport: str | None = None
+    ) -> list[dict]:
+        """
+        Miles needed to be in the top ``percent`` % of each event.
+
+        Args:
+            percents (list[float]): Top percentages, e.g. [10, 50]
+            sport (str | None): Keep only this sport (case-insensitive substring)
+        Returns:
+            list[dict]: Per year, the participant count and the threshold of each percentage
+        """
+        result = []
+        for columns in self.columns:
+            miles = columns.sport_miles(sport)
+            thresholds = {}
+            for percent in percents:
+                # Miles of the last performance within the top percent
+                position = max(math.ceil(len(miles) * percent / 100), 1)
+                thresholds[f"{percent:g}"] = miles[position - 1] if miles else None
+            result.append(
+                {"year": columns.year, "participants": len(miles), "thresholds": thresholds}
+            )
+        return result
+
+    def athlete_deltas(self, canonical_name: str) -> list[dict]:
+        """
+        Best result of an athlete at each event they took part in, with the
+        changes in miles and rank from their previous event.
+        """
+        result = []
+        previous: dict | None = None
+        for columns in self.columns:
+            try:
+                # Rows are in rank order: the first one is the best
+                index = columns.athletes.index(canonical_name)
+            except ValueError:
+                continue
+            entry = {
+                "year": columns.year,
+                "athlete": columns.names[index],
+                "sport": columns.sports[index],
+                "rank": index + 1,
+                "participants": columns.count,
+                "miles": columns.miles[index],
+                "delta_miles": (
+                    round(columns.miles[index] - previous["miles"], 2)
+                    if previous
+                    else None
+                ),
+                "delta_rank": index + 1 - previous["rank"] if previous else None,
+            }
+            result.append(entry)
+            previous = entry
+        return result
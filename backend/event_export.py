@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import zlib
+from typing import Iterable, Iterator
+
+from api.json_response import encode_json
+from models.event import Event
+from utils import Utils
+
+
+class EventExport:
+    """
+    Streaming NDJSON export of event lap data, one JSON line per performance
+    or per lap, produced lazily so that no full event dict is ever built.
+    """
+
+    GRANULARITIES = ("performance", "lap")
+    # Lines are grouped in chunks of about this size before being yielded
+    CHUNK_SIZE = 64 * 1024
+
+    @classmethod
+    def records(cls, event: Event, granularity: str = "performance") -> Iterator[dict]:
+        """
+        Yield the export records of an event, performances in rank order.
+
+        Args:
+            event (Event): The event to export
+            granularity (str): "performance" (one record with all its laps per
+                performance) or "lap" (one record per lap)
+        Returns:
+            Iterator[dict]: The records
+        """
+        if granularity not in cls.GRANULARITIES:
+            raise ValueError(f"Unknown export granularity: {granularity}")
+        year = event.date.year
+        for rank, performance in enumerate(event.performances, start=1):
+            if granularity == "performance":
+                yield {
+                    "event": event.name,
+                    "year": year,
+                    "rank": rank,
+                    **performance.to_dict(laps=True),
+                }
+                continue
+            cumulative_times = performance.cumulative_times()
+            for lap_number, lap_time_ss in enumerate(performance.lap_times, start=1):
+                yield {
+                    "event": event.name,
+                    "year": year,
+                    "rank": rank,
+                    "athlete": performance.athlete.name,
+                    "sport": performance.sport,
+                    "lap": lap_number,
+                    "time_ss": lap_time_ss,
+                    "time": Utils.seconds_to_hhmmss(lap_time_ss),
+                    "elapsed_ss": cumulative_times[lap_number],
+                }
+
+    @classmethod
+    def ndjson(
+        cls, events: Iterable[Event], granularity: str = "performance"
+    ) -> Iterator[bytes]:
+        """Yield NDJSON bytes for the given events, in chunks of about CHUNK_SIZE."""
+        chunk: list[bytes] = []
+        size = 0
+        for event in events:
+            for record in cls.records(event, granularity):
+                line = encode_json(record) + b"\n"
+                chunk.append(line)
+                size += len(line)
+                if size >= cls.CHUNK_SIZE:
+                    yield b"".join(chunk)
+                    chunk.clear()
+                    size = 0
+        if chunk:
+            yield b"".join(chunk)
+
+    @classmethod
+    def gzipped(cls, chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+        """Compress a stream of chunks into a gzip stream, on the fly."""
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
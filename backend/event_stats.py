@@ -4,25 +4,108 @@ from models.event import Event
 from models.performance import Performance
 
 
+class PerformanceSummary:
+    """
+    One precomputed row of an event summary table.
+    """
+
+    def __init__(self, performance: Performance, rank: int) -> None:
+        self.performance: Performance = performance
+        self.rank: int = rank
+        self.sport: str = performance.sport
+        self.total_miles: float = performance.total_miles()
+        self._dict: dict = {
+            "athlete": performance.athlete.to_dict(),
+            "category": performance.category,
+            "age_group": performance.age_group,
+            "sport": performance.sport,
+            "total_miles": self.total_miles,
+            "total_laps": performance.total_laps(),
+            "total_time": performance.total_time_hhmmss(),
+            "average_speed_kph": performance.average_speed_kph(),
+        }
+
+    def to_dict(self, position: bool = False) -> dict:
+        if position:
+            return {"position": self.rank, **self._dict}
+        return self._dict
+
+
 class EventStats:
+    _cache: dict[Event, EventStats] = {}
+
     def __init__(self, event: Event) -> None:
         self.event: Event = event
+        self.rows: list[PerformanceSummary] = [
+            PerformanceSummary(performance, rank)
+            for rank, performance in enumerate(
+                sorted(
+                    event.performances,
+                    key=lambda performance: performance.total_miles(),
+                    reverse=True,
+                ),
+                start=1,
+            )
+        ]
+
+    @classmethod
+    def of(cls, event: Event) -> EventStats:
+        """Return the cached stats of an event, rebuilt if performances were added."""
+        stats = cls._cache.get(event)
+        if stats is None or len(stats.rows) != len(event.performances):
+            stats = cls._cache[event] = cls(event)
+        return stats
 
     def _sorted_performances(self) -> list[Performance]:
-        return sorted(
-            self.event.performances,
-            key=lambda performance: performance.total_miles(),
-            reverse=True,
-        )
+        return [row.performance for row in self.rows]
 
-    def by_sport(self, sport: str) -> list[Performance]:
+    def rows_by_sport(self, sport: str) -> list[PerformanceSummary]:
         sport = sport.lower()
+        return [row for row in self.rows if sport in row.sport.lower()]
 
-        return [
-            performance
-            for performance in self._sorted_performances()
-            if sport in performance.sport.lower()
-        ]
+    def by_sport(self, sport: str) -> list[Performance]:
+        return [row.performance for row in self.rows_by_sport(sport)]
+
+    def top_rows(self, n: int) -> list[PerformanceSummary]:
+        return self.rows[:n]
+
+    def select_rows(
+        self,
+        athletes: list[str] | None = None,
+        sport: str | None = None,
+        category: str | None = None,
+        rank_from: int = 1,
+        rank_to: int | None = None,
+    ) -> list[PerformanceSummary]:
+        """
+        Select rows, in rank order, matching every given filter.
+
+        Args:
+            athletes (list[str] | None): Canonical names of the athletes to keep
+            sport (str | None): Case-insensitive substring of the sport
+            category (str | None): Case-insensitive category
+            rank_from (int): First rank to keep (1-indexed, inclusive)
+            rank_to (int | None): Last rank to keep (inclusive)
+        Returns:
+            list[PerformanceSummary]: The matching rows
+        """
+        rows = self.rows[max(rank_from, 1) - 1 : rank_to]
+        if athletes is not None:
+            wanted = set(athletes)
+            rows = [
+                row for row in rows
+                if row.performance.athlete.canonical_name in wanted
+            ]
+        if sport:
+            sport = sport.lower()
+            rows = [row for row in rows if sport in row.sport.lower()]
+        if category:
+            category = category.lower()
+            rows = [
+                row for row in rows
+                if row.performance.category.lower() == category
+            ]
+        return rows
 
     def top(
         self, n: int, performances: list[Performance] | None = None
@@ -0,0 +1,57 @@
+"""
+Export the lap data of the scraped events as NDJSON.
+
+Run with: uv run python export_events.py --granularity lap --gzip -o laps.ndjson.gz
+"""
+
+import argparse
+import contextlib
+import sys
+
+from api.loader import load_events
+from event_export import EventExport
+from models.event_registry import EventRegistry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--granularity",
+        choices=EventExport.GRANULARITIES,
+        default="performance",
+        help="One line per performance (default) or per lap",
+    )
+    parser.add_argument("--name", help="Only export events with this name")
+    parser.add_argument("--year", type=int, help="Only export events of this year")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the output")
+    parser.add_argument(
+        "-o", "--output", help="Output file (default: standard output)"
+    )
+    args = parser.parse_args()
+
+    # Keep loader logs out of the NDJSON written to stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        load_events()
+
+    events = [
+        event
+        for event in EventRegistry.events
+        if (args.name is None or event.name.lower() == args.name.lower())
+        and (args.year is None or event.date.year == args.year)
+    ]
+    chunks = EventExport.ndjson(events, args.granularity)
+    if args.gzip:
+        chunks = EventExport.gzipped(chunks)
+
+    with contextlib.ExitStack() as stack:
+        output = (
+            stack.enter_context(open(args.output, "wb"))
+            if args.output
+            else sys.stdout.buffer
+        )
+        for chunk in chunks:
+            output.write(chunk)
+
+
+if __name__ == "__main__":
+    main()
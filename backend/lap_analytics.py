@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import math
+import statistics
+from itertools import islice
+from operator import sub
+from typing import Iterator
+
+from event_stats import EventStats
+from models.event import Event
+from models.performance import Performance
+
+
+class PerformanceLaps:
+    """
+    Lap analytics of one performance, computed from its lap column and its
+    cumulative times (prefix sums) with C-level ``map``/``min`` passes rather
+    than per-lap Python code.
+    """
+
+    # A lap is a pit stop when slower than median + PIT_MAD_FACTOR robust
+    # standard deviations (1.4826 * MAD), and at least PIT_MIN_RATIO * median
+    PIT_MAD_FACTOR = 5.0
+    PIT_MIN_RATIO = 1.5
+
+    def __init__(self, performance: Performance) -> None:
+        self.performance: Performance = performance
+        self.lap_times = performance.lap_times
+        self.cumulative_times = performance.cumulative_times()
+        self.length_miles: float = performance.event.track.length_miles
+        self.median_lap_ss: float = (
+            statistics.median(self.lap_times) if self.lap_times else 0.0
+        )
+        self.pit_threshold_ss: float = self.__pit_threshold()
+        self.pit_laps: list[int] = [
+            lap_number
+            for lap_number, lap_time_ss in enumerate(self.lap_times, start=1)
+            if lap_time_ss > self.pit_threshold_ss
+        ]
+
+    def __pit_threshold(self) -> float:
+        if not self.lap_times:
+            return 0.0
+        median = self.median_lap_ss
+        mad = statistics.median(abs(lap_time_ss - median) for lap_time_ss in self.lap_times)
+        return max(
+            median + self.PIT_MAD_FACTOR * 1.4826 * mad,
+            median * self.PIT_MIN_RATIO,
+        )
+
+    def window_times(self, laps: int) -> list[int]:
+        """Time of every run of ``laps`` consecutive laps, by starting lap."""
+        if laps <= 0 or laps > len(self.lap_times):
+            return []
+        cumulative_times = self.cumulative_times
+        return list(map(sub, islice(cumulative_times, laps, None), cumulative_times))
+
+    def speed_mph(self, laps: int, time_ss: float) -> float:
+        if time_ss <= 0:
+            return 0.0
+        return self.length_miles * laps / (time_ss / 3600)
+
+    def rolling_speed_mph(self, window: int) -> list[float]:
+        """Average speed over the last ``window`` laps, at the end of each lap from lap ``window``."""
+        return [
+            round(self.speed_mph(window, time_ss), 2)
+            for time_ss in self.window_times(window)
+        ]
+
+    def stretch(self, laps: int, fastest: bool = True) -> dict | None:
+        """
+        Fastest (or slowest) run of ``laps`` consecutive laps.
+
+        Returns:
+            dict | None: Its first lap, time and average speed, or None if the
+                performance has fewer laps
+        """
+        window_times = self.window_times(laps)
+        if not window_times:
+            return None
+        time_ss = min(window_times) if fastest else max(window_times)
+        return {
+            "start_lap": window_times.index(time_ss) + 1,
+            "time_ss": time_ss,
+            "speed_mph": round(self.speed_mph(laps, time_ss), 2),
+        }
+
+    def hourly_miles(self, hours: int) -> list[float]:
+        """Distance covered during each hour of the race."""
+        laps_at_hour = [
+            self.performance.laps_at_time_ss(hour * 3600) for hour in range(hours + 1)
+        ]
+        return [
+            round(self.length_miles * laps, 2)
+            for laps in map(sub, islice(laps_at_hour, 1, None), laps_at_hour)
+        ]
+
+    def fatigue_slope_ss_per_hour(self) -> float | None:
+        """
+        Trend of the lap time over the race, pit stops excluded: seconds added
+        to a lap per hour elapsed (least squares), or None with too few laps.
+        """
+        pit_laps = set(self.pit_laps)
+        elapsed_hours: list[float] = []
+        lap_times: list[int] = []
+        for lap_number, lap_time_ss in enumerate(self.lap_times, start=1):
+            if lap_number not in pit_laps:
+                elapsed_hours.append(self.cumulative_times[lap_number] / 3600)
+                lap_times.append(lap_time_ss)
+        try:
+            slope, _ = statistics.linear_regression(elapsed_hours, lap_times)
+        except statistics.StatisticsError:
+            return None
+        return round(slope, 2)
+
+    def pit_time_lost_ss(self) -> int:
+        """Time spent in pit laps beyond a median lap."""
+        return round(
+            sum(self.lap_times[lap - 1] - self.median_lap_ss for lap in self.pit_laps)
+        )
+
+
+class LapAnalytics:
+    """
+    Lap analytics of a whole event, returned as columns: every list holds one
+    value per performance, in rank order (``rank`` and ``athlete`` columns).
+
+    Only the rank order is cached: lap columns are read when computing, so the
+    event can still have its laps unloaded by the EventRegistry.
+    """
+
+    _cache: dict[Event, LapAnalytics] = {}
+
+    def __init__(self, event: Event) -> None:
+        self.event: Event = event
+        self.rows = EventStats.of(event).rows
+        longest_time_ss = max(
+            (row.performance.total_time_ss for row in self.rows), default=0
+        )
+        self.hours: int = math.ceil(longest_time_ss / 3600)
+
+    @classmethod
+    def of(cls, event: Event) -> LapAnalytics:
+        """Return the cached analytics of an event, rebuilt if performances were added."""
+        analytics = cls._cache.get(event)
+        if analytics is None or len(analytics.rows) != len(event.performances):
+            analytics = cls._cache[event] = cls(event)
+        return analytics
+
+    def performance_laps(self) -> Iterator[PerformanceLaps]:
+        for row in self.rows:
+            yield PerformanceLaps(row.performance)
+
+    def columns(self) -> dict[str, list]:
+        return {
+            "rank": [row.rank for row in self.rows],
+            "athlete": [row.performance.athlete.name for row in self.rows],
+            "sport": [row.sport for row in self.rows],
+        }
+
+    def summary(self, stretch_laps: int = 10) -> dict[str, list]:
+        """
+        Per-performance analytics in one pass over the event.
+
+        Args:
+            stretch_laps (int): Length of the fastest / slowest stretches, in laps
+        Returns:
+            dict[str, list]: Columns of the median lap, fastest and slowest
+                stretches, fatigue slope, pit stops and hourly distances
+        """
+        columns = self.columns()
+        columns.update(
+            {
+                "median_lap_ss": [],
+                "fastest_stretch": [],
+                "slowest_stretch": [],
+                "fatigue_slope_ss_per_hour": [],
+                "pit_stop_laps": [],
+                "pit_time_lost_ss": [],
+                "hourly_miles": [],
+            }
+        )
+        for laps in self.performance_laps():
+            columns["median_lap_ss"].append(laps.median_lap_ss)
+            columns["fastest_stretch"].append(laps.stretch(stretch_laps))
+            columns["slowest_stretch"].append(laps.stretch(stretch_laps, fastest=False))
+            columns["fatigue_slope_ss_per_hour"].append(laps.fatigue_slope_ss_per_hour())
+            columns["pit_stop_laps"].append(laps.pit_laps)
+            columns["pit_time_lost_ss"].append(laps.pit_time_lost_ss())
+            columns["hourly_miles"].append(laps.hourly_miles(self.hours))
+        return {"stretch_laps": stretch_laps, "hours": self.hours, **columns}
+
+    def rolling_speed(self, window: int = 10) -> dict[str, list]:
+        """
+        Rolling average speed of every performance.
+
+        Args:
+            window (int): Number of laps averaged
+        Returns:
+            dict[str, list]: Columns with, per performance, the speed in mph over
+                the ``window`` laps ending at each lap from lap ``window`` on
+        """
+        columns = self.columns()
+        columns["speed_mph"] = [laps.rolling_speed_mph(window) for laps in self.performance_laps()]
+        return {"window": window, **columns}
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import heapq
+from bisect import insort
+from itertools import product
+
+from milestone_splits import MilestoneSplits
+from models.event import Event
+from models.performance import Performance
+
+
+class LeaderboardEntry:
+    """
+    One performance as ranked by the leaderboards, with its split times.
+    """
+
+    def __init__(
+        self, performance: Performance, split_times: dict[float, int | None]
+    ) -> None:
+        """
+        :param performance: The ranked performance.
+        :param split_times: Elapsed time at which each split distance was
+            reached (None if never).
+        """
+        self.performance: Performance = performance
+        self.canonical_name: str = performance.athlete.canonical_name
+        self.miles: float = performance.total_miles()
+        self.split_times: dict[float, int | None] = split_times
+        event = performance.event
+        self._dict: dict = {
+            "athlete": performance.athlete.name,
+            "gender": performance.athlete.gender,
+            "sport": performance.sport,
+            "category": performance.category,
+            "age_group": performance.age_group,
+            "event_name": event.name,
+            "year": event.date.year,
+            "total_miles": self.miles,
+            "total_time": performance.total_time_hhmmss(),
+        }
+
+    def to_dict(self, split_miles: float | None = None) -> dict:
+        if split_miles is None:
+            return self._dict
+        return {
+            **self._dict,
+            "split_miles": split_miles,
+            "split_time_ss": self.split_times[split_miles],
+        }
+
+
+class Leaderboard:
+    """
+    All-time leaderboards across the registered events, maintained as events
+    are added (at load).
+
+    Every performance is inserted in sorted boards, one per combination of
+    sport, gender and age group where each of them may be "any" (""): top-k
+    queries are slices of a board, never a rescan of the performances.
+
+    Team / relay performances are kept on boards of their own (``teams``) and
+    are left out of the most events ranking, so individual records only
+    compare individual athletes.
+    """
+
+    # Distances (miles) of the fastest split boards
+    split_miles: tuple[float, ...] = MilestoneSplits.default_miles
+    # Most miles first
+    _distance_boards: dict[tuple[bool, str, str, str], list[LeaderboardEntry]] = {}
+    # Fastest first, only performances that reached the distance
+    _split_boards: dict[
+        float, dict[tuple[bool, str, str, str], list[LeaderboardEntry]]
+    ] = {}
+    # Events completed by each individual athlete (canonical name -> event slugs)
+    _events_by_athlete: dict[str, set[str]] = {}
+    _names: dict[str, str] = {}
+
+    @classmethod
+    def board_keys(cls, performance: Performance) -> list[tuple[bool, str, str, str]]:
+        """Keys of every board a performance belongs to ("" matching any value)."""
+        # Deduplicated: an empty gender or age group is already the "any" key
+        return list(
+            dict.fromkeys(
+                product(
+                    (performance.athlete.team,),
+                    ("", performance.sport.lower()),
+                    ("", performance.athlete.gender.lower()),
+                    ("", performance.age_group.lower()),
+                )
+            )
+        )
+
+    @classmethod
+    def add_event(cls, event: Event) -> None:
+        """Index every performance of an event in the leaderboards."""
+        splits = MilestoneSplits.of(event, cls.split_miles)
+        for performance in event.performances:
+            cls.add_performance(
+                performance,
+                {miles: splits.time_ss(performance, miles) for miles in splits.miles},
+            )
+
+    @classmethod
+    def add_performance(
+        cls, performance: Performance, split_times: dict[float, int | None]
+    ) -> None:
+        entry = LeaderboardEntry(performance, split_times)
+        keys = cls.board_keys(performance)
+        for key in keys:
+            insort(
+                cls._distance_boards.setdefault(key, []),
+                entry,
+                key=lambda entry: -entry.miles,
+            )
+        for miles, time_ss in entry.split_times.items():
+            if time_ss is None:
+                continue
+            boards = cls._split_boards.setdefault(miles, {})
+            for key in keys:
+                insort(
+                    boards.setdefault(key, []),
+                    entry,
+                    key=lambda entry: entry.split_times[miles],
+                )
+        if performance.athlete.team:
+            return
+        cls._events_by_athlete.setdefault(entry.canonical_name, set()).add(
+            performance.event.slug
+        )
+        cls._names.setdefault(entry.canonical_name, performance.athlete.name)
+
+    @classmethod
+    def board_key(
+        cls,
+        sport: str | None,
+        gender: str | None,
+        age_group: str | None,
+        teams: bool = False,
+    ) -> tuple[bool, str, str, str]:
+        return (
+            teams,
+            (sport or "").lower(),
+            (gender or "").lower(),
+            (age_group or "").lower(),
+        )
+
+    @classmethod
+    def _top(
+        cls, board: list[LeaderboardEntry], k: int, unique_athletes: bool
+    ) -> list[LeaderboardEntry]:
+        if not unique_athletes:
+            return board[:k]
+        # Best entry of each athlete: walk the board until k athletes are found
+        top: list[LeaderboardEntry] = []
+        seen: set[str] = set()
+        for entry in board:
+            if entry.canonical_name in seen:
+                continue
+            seen.add(entry.canonical_name)
+            top.append(entry)
+            if len(top) == k:
+                break
+        return top
+
+    @classmethod
+    def top_distance(
+        cls,
+        k: int = 10,
+        sport: str | None = None,
+        gender: str | None = None,
+        age_group: str | None = None,
+        unique_athletes: bool = True,
+        teams: bool = False,
+    ) -> list[dict]:
+        """
+        Most miles in one event, all-time.
+
+        Args:
+            k (int): Number of entries
+            sport (str | None): Exact sport (case-insensitive), any if None
+            gender (str | None): Exact gender (case-insensitive), any if None
+            age_group (str | None): Exact age group (case-insensitive), any if None
+            unique_athletes (bool): Keep only the best performance of each athlete
+            teams (bool): Rank team performances instead of individual ones
+        Returns:
+            list[dict]: The entries, best first, with their position
+        """
+        board = cls._distance_boards.get(
+            cls.board_key(sport, gender, age_group, teams), []
+        )
+        return [
+            {"position": position, **entry.to_dict()}
+            for position, entry in enumerate(
+                cls._top(board, k, unique_athletes), start=1
+            )
+        ]
+
+    @classmethod
+    def top_split(
+        cls,
+        miles: float,
+        k: int = 10,
+        sport: str | None = None,
+        gender: str | None = None,
+        age_group: str | None = None,
+        unique_athletes: bool = True,
+        teams: bool = False,
+    ) -> list[dict] | None:
+        """
+        Fastest times to reach ``miles`` (one of ``split_miles``), all-time.
+
+        Returns:
+            list[dict] | None: The entries, fastest first, or None if ``miles``
+                is not an indexed split distance
+        """
+        if miles not in cls.split_miles:
+            return None
+        boards = cls._split_boards.get(miles, {})
+        board = boards.get(cls.board_key(sport, gender, age_group, teams), [])
+        return [
+            {"position": position, **entry.to_dict(split_miles=miles)}
+            for position, entry in enumerate(
+                cls._top(board, k, unique_athletes), start=1
+            )
+        ]
+
+    @classmethod
+    def most_events(cls, k: int = 10) -> list[dict]:
+        """Individual athletes who completed the most events (ties by name)."""
+        top = heapq.nsmallest(
+            k,
+            cls._events_by_athlete.items(),
+            key=lambda item: (-len(item[1]), cls._names[item[0]].lower()),
+        )
+        return [
+            {
+                "position": position,
+                "athlete": cls._names[name],
+                "event_count": len(slugs),
+            }
+            for position, (name, slugs) in enumerate(top, start=1)
+        ]
+
+    @classmethod
+    def records(cls) -> dict:
+        """Individual holders of the distance and split records, overall and per sport."""
+        overall = cls._distance_boards.get(cls.board_key(None, None, None), [])
+        sports = sorted({entry.performance.sport for entry in overall})
+        result = {}
+        for sport in [None] + sports:
+            distance = cls.top_distance(k=1, sport=sport)
+            result[sport or "all"] = {
+                "distance": distance[0] if distance else None,
+                "splits": {
+                    f"{miles:g}": next(
+                        iter(cls.top_split(miles, k=1, sport=sport) or []), None
+                    )
+                    for miles in cls.split_miles
+                },
+            }
+        return result
+
+    @classmethod
+    def clear(cls) -> None:
+        """Reset the leaderboards (useful for testing)."""
+        cls._distance_boards.clear()
+        cls._split_boards.clear()
+        cls._events_by_athlete.clear()
+        cls._names.clear()
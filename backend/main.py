@@ -1,11 +1,8 @@
-import os
+import csv
 from file_manager import FileManager
-from webscraper.event_scraper import EventScraper
-from webscraper.browser_manager import BrowserManager
-from event_params_data import miami_event_params
 from models.event import Event
 from models.event_registry import EventRegistry
-from event_stats import EventStats
+from event_comparer import EventComparer
 from scraper import scrape_events
 
 
@@ -16,43 +13,59 @@ def main():
         event = Event.from_json_file(file)
         EventRegistry.add_event(event)
 
-    unique_sports = set()
-    unique_categories = set()
-    unique_age_groups = set()
+    comparer = EventComparer.of(EventRegistry.events)
 
-    for event in EventRegistry.events:
-        if event.date.year:
-            print("\n", event.track.city, event.date.year)
+    for stats in comparer.events:
+        event = stats.event
+        print("\n", event.track.city, event.date.year)
 
-            for performance in event.performances:
-                unique_sports.add(performance.sport)
-                unique_categories.add(performance.category)
-                unique_age_groups.add(performance.age_group)
-
-            event_stats = EventStats(event)
-            # event_stats.print_all(event_stats.top(100))
-
-            # Output to CSV
-            with open("event_stats_" + str(event.date.year) + ".csv", "w") as f:
-                f.write(
-                    "Name,Sport,Discipline,Age Category,Total Miles,Total Laps,Average Speed (kph),Total Time (HH:MM:SS)\n"
+        # Output to CSV
+        with open(
+            "event_stats_" + str(event.date.year) + ".csv", "w", newline=""
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "Name",
+                    "Sport",
+                    "Discipline",
+                    "Age Category",
+                    "Total Miles",
+                    "Total Laps",
+                    "Average Speed (kph)",
+                    "Total Time (HH:MM:SS)",
+                ]
+            )
+            for row in stats.rows:
+                summary = row.to_dict()
+                writer.writerow(
+                    [
+                        summary["athlete"]["name"],
+                        summary["sport"],
+                        summary["category"],
+                        summary["age_group"],
+                        summary["total_miles"],
+                        summary["total_laps"],
+                        round(summary["average_speed_kph"], 2),
+                        summary["total_time"],
+                    ]
                 )
-                for performance in event_stats.get_all():
-                    f.write(
-                        f"{performance.athlete.name},{performance.sport},{performance.category},{performance.age_group}, {performance.athlete.team}\n"
-                    )
 
     print("\nUnique sports in all events:")
-    for sport in sorted(unique_sports):
+    for sport in comparer.distinct("sports"):
         print("-", sport)
 
     print("\nUnique categories in all events:")
-    for category in sorted(unique_categories):
+    for category in comparer.distinct("categories"):
         print("-", category)
     print("\nUnique age groups in all events:")
-    for age_group in sorted(unique_age_groups):
+    for age_group in comparer.distinct("age_groups"):
         print("-", age_group)
 
+    print("\nParticipants per year:")
+    for year in comparer.participation():
+        print(f"- {year['year']}: {year['participants']} ({year['by_sport']})")
+
 
 if __name__ == "__main__":
     main()
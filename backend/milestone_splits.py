@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterable
+
+from event_stats import EventStats
+from models.event import Event
+from models.performance import Performance
+
+
+class MilestoneSplits:
+    """
+    Time at which every performance of an event reached each milestone
+    distance (e.g. 50 / 100 / 200 miles).
+
+    The track length is the same for the whole event, so each milestone maps
+    to one lap number, computed once per event. A performance then reaches
+    the milestones up to a bisection of its lap count in those (sorted) lap
+    numbers, and the split times are lookups in its cumulative lap times.
+    """
+
+    default_miles: tuple[float, ...] = (50, 100, 200)
+    # Longest milestone (miles): beyond any performance, and a bound on the
+    # lap numbers computed from user input
+    max_miles: float = 1000
+    _cache: dict[tuple[Event, tuple[float, ...]], MilestoneSplits] = {}
+
+    def __init__(self, event: Event, miles: Iterable[float]) -> None:
+        self.event: Event = event
+        self.miles: tuple[float, ...] = self.milestones(miles)
+        self.laps: list[int] = [
+            event.track.laps_for_miles(miles) for miles in self.miles
+        ]
+        self.rows = EventStats.of(event).rows
+        # Split times of each performance (None for the milestones not reached)
+        self.times: dict[Performance, list[int | None]] = {
+            row.performance: self.__split_times(row.performance) for row in self.rows
+        }
+
+    @classmethod
+    def of(cls, event: Event, miles: Iterable[float] | None = None) -> MilestoneSplits:
+        """Return the cached splits of an event, rebuilt if performances were added."""
+        miles = cls.milestones(cls.default_miles if miles is None else miles)
+        splits = cls._cache.get((event, miles))
+        if splits is None or len(splits.rows) != len(event.performances):
+            splits = cls._cache[(event, miles)] = cls(event, miles)
+        return splits
+
+    @classmethod
+    def milestones(cls, miles: Iterable[float]) -> tuple[float, ...]:
+        """Sorted distinct milestones, keeping only distances in ]0, max_miles] (no inf / NaN)."""
+        return tuple(sorted({m for m in miles if 0 < m <= cls.max_miles}))
+
+    def __split_times(self, performance: Performance) -> list[int | None]:
+        cumulative_times = performance.cumulative_times()
+        reached = bisect_right(self.laps, performance.total_laps())
+        return [cumulative_times[lap] for lap in self.laps[:reached]] + [None] * (
+            len(self.laps) - reached
+        )
+
+    def time_ss(self, performance: Performance, miles: float) -> int | None:
+        """Elapsed time at which a performance reached one of the milestones (None if never)."""
+        return self.times[performance][self.miles.index(miles)]
+
+    def to_dict(self) -> dict:
+        """
+        Columns of the splits, one entry per performance in rank order.
+
+        Returns:
+            dict: Milestones and their lap numbers, ranks, athletes, and the
+                split times in seconds of each milestone
+        """
+        times = [self.times[row.performance] for row in self.rows]
+        return {
+            "miles": list(self.miles),
+            "laps": self.laps,
+            "rank": [row.rank for row in self.rows],
+            "athlete": [row.performance.athlete.name for row in self.rows],
+            "times_ss": {
+                f"{miles:g}": [split_times[index] for split_times in times]
+                for index, miles in enumerate(self.miles)
+            },
+        }
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from models.athlete import Athlete
+
+if TYPE_CHECKING:
+    from models.performance import Performance
+
+
+class AthleteCareer:
+    """
+    Career aggregates of one athlete across all registered events.
+    """
+
+    def __init__(self, athlete: Athlete, performances: list[Performance]) -> None:
+        """
+        Compute the career aggregates of an athlete.
+
+        :param athlete: The (canonical) athlete.
+        :param performances: Every registered performance of the athlete.
+        """
+        self.athlete: Athlete = athlete
+        # Chronological, and by distance within one event
+        self.performances: list[Performance] = sorted(
+            performances, key=lambda p: (p.event.date, -p.total_miles())
+        )
+        self.total_miles: float = sum(p.total_miles() for p in self.performances)
+        self.total_km: float = sum(p.total_km() for p in self.performances)
+        self.best_performance: Performance | None = max(
+            self.performances, key=lambda p: p.total_miles(), default=None
+        )
+        self.best_event_miles: float = (
+            self.best_performance.total_miles() if self.best_performance else 0.0
+        )
+        self.sports: list[str] = sorted({p.sport for p in self.performances})
+        self.event_count: int = len(
+            {(p.event.name, p.event.date.year) for p in self.performances}
+        )
+
+    def to_dict(self, performances: bool = False) -> dict:
+        result: dict = {
+            "name": self.athlete.name,
+            "gender": self.athlete.gender,
+            "city": self.athlete.city,
+            "state": self.athlete.state,
+            "country": self.athlete.country,
+            "team": self.athlete.team,
+            "event_count": self.event_count,
+            "total_miles": round(self.total_miles, 2),
+        }
+        if not performances:
+            result["best_event_miles"] = round(self.best_event_miles, 2)
+            result["sports"] = self.sports
+            return result
+
+        result["total_km"] = round(self.total_km, 2)
+        result["performances"] = [
+            {
+                "event_name": p.event.name,
+                "year": p.event.date.year,
+                "date": p.event.date.isoformat(),
+                "sport": p.sport,
+                "category": p.category,
+                "total_laps": p.total_laps(),
+                "total_miles": p.total_miles(),
+                "total_km": p.total_km(),
+                "average_speed_mph": round(p.average_speed_mph(), 2),
+                "average_speed_kph": round(p.average_speed_kph(), 2),
+                "total_time_hhmmss": p.total_time_hhmmss(),
+            }
+            for p in self.performances
+        ]
+        return result
@@ -3,14 +3,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from models.athlete import Athlete
+from models.athlete_career import AthleteCareer
 
 if TYPE_CHECKING:
     from models.event import Event
+    from models.performance import Performance
 
 
 class AthleteRegistry:
     athletes: list[Athlete] = []
     _by_canonical: dict[str, Athlete] = {}
+    # Performances of registered events, keyed by canonical name
+    _performances_by_canonical: dict[str, list[Performance]] = {}
+    _careers: dict[str, AthleteCareer] = {}
     total_count: int = 0
 
     @classmethod
@@ -54,11 +59,42 @@ class AthleteRegistry:
         tmp = Athlete(name=name)
         return cls._by_canonical.get(tmp.canonical_name)
 
+    @classmethod
+    def register_event(cls, event: Event) -> None:
+        """Index every performance of an event under its athlete."""
+        for performance in event.performances:
+            cls.register_performance(performance)
+
+    @classmethod
+    def register_performance(cls, performance: Performance) -> None:
+        """Index a performance under its athlete and invalidate their career."""
+        key = performance.athlete.canonical_name
+        cls._performances_by_canonical.setdefault(key, []).append(performance)
+        cls._careers.pop(key, None)
+
+    @classmethod
+    def performances_of(cls, athlete: Athlete) -> list[Performance]:
+        """Return the indexed performances of an athlete, in registration order."""
+        return cls._performances_by_canonical.get(athlete.canonical_name, [])
+
+    @classmethod
+    def career(cls, athlete: Athlete) -> AthleteCareer:
+        """Return the (cached) career aggregates of an athlete."""
+        key = athlete.canonical_name
+        career = cls._careers.get(key)
+        if career is None:
+            career = cls._careers[key] = AthleteCareer(
+                athlete, cls.performances_of(athlete)
+            )
+        return career
+
     @classmethod
     def clear(cls) -> None:
         """Reset the registry (useful for testing)."""
         cls.athletes.clear()
         cls._by_canonical.clear()
+        cls._performances_by_canonical.clear()
+        cls._careers.clear()
 
     @classmethod
     def count(cls) -> int:
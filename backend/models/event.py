@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from array import array
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -25,6 +26,11 @@ class Event:
         """
         self.performances: list[Performance] = []
         self.name: str = ''
+        # Digest of the file the event was loaded from (empty when scraped)
+        self.source_hash: str = ''
+        # Snapshot the lap columns can be (re)hydrated from, if any
+        self.file_path: str = ''
+        self._lap_offsets: list[tuple[Performance, int]] = []
 
         if event_params is not None:
             self.date: datetime = event_params.date
@@ -36,8 +42,63 @@ class Event:
         name_part = self.name.lower().replace(' ', '-')
         return f'{name_part}_{self.date.year}'
 
-    def add_performance(self, performance: Performance) -> None:
+    def add_performance(
+        self, performance: Performance, lap_offset: int | None = None
+    ) -> None:
+        """
+        Add a performance to the event.
+
+        :param performance: The performance to add.
+        :param lap_offset: Offset of the performance laps in the snapshot lap
+            column, when the event was loaded from a snapshot.
+        """
         self.performances.append(performance)
+        if lap_offset is not None:
+            self._lap_offsets.append((performance, lap_offset))
+
+    @property
+    def laps_loaded(self) -> bool:
+        return all(p.laps_loaded for p in self.performances)
+
+    def ensure_laps(self, performance: Performance) -> array:
+        """Hydrate the lap columns of this event if they were unloaded.
+
+        Goes through the EventRegistry so the number of hydrated events stays
+        bounded.
+
+        :param performance: The performance whose lap column is needed.
+        :return: Its lap column, read while the event was still hydrated (it
+            may be unloaded again by another thread right after).
+        """
+        from models.event_registry import EventRegistry
+
+        lap_times = EventRegistry.hydrate(self, performance)
+        if lap_times is None:
+            raise RuntimeError(f"No lap column to hydrate for {performance}")
+        return lap_times
+
+    def load_laps(self) -> None:
+        """Read the lap columns of every performance back from the snapshot."""
+        from models.event_snapshot import EventSnapshot
+
+        if not self.file_path:
+            raise RuntimeError(f"No snapshot to hydrate {self.name} laps from")
+        lap_column = EventSnapshot.read_lap_column(self.file_path, self.source_hash)
+        for performance, lap_offset in self._lap_offsets:
+            performance.set_lap_times(
+                lap_column[lap_offset : lap_offset + performance.total_laps()]
+            )
+
+    def unload_laps(self) -> bool:
+        """Drop the lap columns if they can be hydrated again from the snapshot.
+
+        :return: True if the laps were unloaded.
+        """
+        if not self.file_path or len(self._lap_offsets) != len(self.performances):
+            return False
+        for performance in self.performances:
+            performance.unload_laps()
+        return True
 
     def to_dict(self, performances: bool = True, laps: bool = True) -> dict:
         result = {
@@ -60,7 +121,10 @@ class Event:
     def from_json_file(cls, file_name: str) -> Event:
         with open(file_name, "r") as json_file:
             event_data = json.load(json_file)
+        return cls.from_dict(event_data)
 
+    @classmethod
+    def from_dict(cls, event_data: dict) -> Event:
         event = cls(event_params=None)
         event.name = event_data.get("name", "")
         event.track = Track.from_dict(track_data=event_data["track"])
@@ -1,28 +1,85 @@
+import threading
+from array import array
+from bisect import insort
+from collections import OrderedDict
+
+from models.athlete_registry import AthleteRegistry
 from models.event import Event
+from models.performance import Performance
 
 
 class EventRegistry:
     events: list[Event] = []
+    # Maximum number of events keeping their lap columns in memory (None = no bound)
+    max_hydrated: int | None = None
+    _hydrated: OrderedDict[Event, None] = OrderedDict()
+    # Guards the hydrated LRU: routes and streamed responses run on threadpool
+    # threads, and one of them hydrating an event may evict another's
+    _hydrate_lock = threading.Lock()
+    # Lookup indexes, each list kept sorted by date like ``events``
+    _by_name_year: dict[tuple[str, int], list[Event]] = {}
+    _by_name: dict[str, list[Event]] = {}
+    _by_year: dict[int, list[Event]] = {}
 
     @classmethod
     def add_event(cls, event: Event) -> bool:
-        cls.events.append(event)
-        cls.events.sort(key=lambda e: e.date)
+        AthleteRegistry.register_event(event)
+        name = event.name.lower()
+        for events in (
+            cls.events,
+            cls._by_name_year.setdefault((name, event.date.year), []),
+            cls._by_name.setdefault(name, []),
+            cls._by_year.setdefault(event.date.year, []),
+        ):
+            insort(events, event, key=lambda e: e.date)
         return True
 
     @classmethod
     def get_by_name_year(cls, name: str, year: int) -> Event | None:
-        for event in cls.events:
-            if event.name.lower() == name.lower() and event.date.year == year:
-                return event
-        return None
+        events = cls._by_name_year.get((name.lower(), year))
+        if not events:
+            return None
+        cls.touch(events[0])
+        return events[0]
+
+    @classmethod
+    def get_by_year(cls, year: int) -> list[Event]:
+        return list(cls._by_year.get(year, []))
+
+    @classmethod
+    def hydrate(
+        cls, event: Event, performance: Performance | None = None
+    ) -> array | None:
+        """Load the lap columns of an event and mark it most recently used.
+
+        When more than ``max_hydrated`` events hold their laps, the least
+        recently used ones are unloaded (they stay registered as stubs).
+
+        Returns:
+            array | None: The lap column of ``performance`` (if given), read
+                under the lock so that a concurrent eviction cannot clear it
+        """
+        with cls._hydrate_lock:
+            if not event.laps_loaded:
+                event.load_laps()
+            cls._hydrated[event] = None
+            cls._hydrated.move_to_end(event)
+            if cls.max_hydrated is not None:
+                while len(cls._hydrated) > max(cls.max_hydrated, 1):
+                    oldest, _ = cls._hydrated.popitem(last=False)
+                    oldest.unload_laps()
+            return performance._lap_times if performance is not None else None
+
+    @classmethod
+    def touch(cls, event: Event) -> None:
+        """Mark a hydrated event as most recently used."""
+        with cls._hydrate_lock:
+            if event in cls._hydrated:
+                cls._hydrated.move_to_end(event)
 
     @classmethod
     def get_by_name(cls, name: str) -> list[Event]:
-        return [
-            event for event in cls.events
-            if event.name.lower() == name.lower()
-        ]
+        return list(cls._by_name.get(name.lower(), []))
 
     @classmethod
     def sort_all_performances(cls) -> None:
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+
+from models.athlete import Athlete
+from models.athlete_registry import AthleteRegistry
+from models.event import Event
+from models.performance import Performance
+from models.track import Track
+from utils import Utils
+
+
+class EventSnapshot:
+    """
+    Compiled binary snapshot of a scraped event JSON file.
+
+    Layout (little-endian, every section 4-byte aligned):
+
+    - header: magic, source file digest, track length, string indexes of the
+      event/track metadata and the section sizes
+    - string table: ``string_count + 1`` offsets followed by the UTF-8 blob
+      of every interned string (athlete fields, categories, age groups...)
+    - performance table: one fixed-size record per performance holding string
+      indexes, the offset/count of its laps in the lap column and its total time
+    - lap column: every lap time of the event, in seconds, as uint32
+
+    Loading a snapshot is a mmap plus a few ``struct`` unpacks and one bulk
+    copy of the lap column; no lap time string is parsed. The lap column can
+    also be skipped entirely and read back later (``read_lap_column``).
+    """
+
+    MAGIC = b"USKSNAP1"
+    EXTENSION = ".snap"
+
+    # magic, source digest, track length, name/date/track name/city/country
+    # string indexes, string count, strings blob size, performance count, lap count
+    _HEADER = struct.Struct("<8s16sd5I4I")
+    # athlete name/gender/city/state/country, category, age group string
+    # indexes, lap offset, lap count, total time in seconds
+    _PERFORMANCE = struct.Struct("<10I")
+
+    @classmethod
+    def path_for(cls, json_file: str) -> str:
+        """Return the snapshot path stored alongside the given JSON file."""
+        return os.path.splitext(json_file)[0] + cls.EXTENSION
+
+    @classmethod
+    def is_fresh(cls, snapshot_file: str, json_file: str) -> bool:
+        """Return True if the snapshot exists and is not older than its JSON source."""
+        try:
+            return os.path.getmtime(snapshot_file) >= os.path.getmtime(json_file)
+        except OSError:
+            return False
+
+    @classmethod
+    def pack(cls, event_data: dict, source_hash: bytes = b"") -> bytes:
+        """
+        Compile the dict form of an event (as written by ``Event.to_json_file``)
+        into a snapshot buffer.
+
+        Args:
+            event_data (dict): Event data as loaded from the JSON file
+            source_hash (bytes): Digest of the JSON source (truncated to 16 bytes)
+        Returns:
+            bytes: The packed snapshot
+        """
+        strings: list[str] = []
+        string_indexes: dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            index = string_indexes.get(value)
+            if index is None:
+                index = string_indexes[value] = len(strings)
+                strings.append(value)
+            return index
+
+        track_data = event_data["track"]
+        metadata_indexes = (
+            intern(event_data.get("name", "")),
+            intern(event_data["date"]),
+            intern(track_data["name"]),
+            intern(track_data["city"]),
+            intern(track_data["country"]),
+        )
+
+        performance_records = bytearray()
+        lap_column = array("I")
+        for performance_data in event_data["performances"]:
+            lap_offset = len(lap_column)
+            for lap_data in performance_data["laps"]:
+                lap_time = Utils.convert_time_str_to_seconds(lap_data["time"])
+                if lap_time is not None:
+                    lap_column.append(lap_time)
+            athlete_data = performance_data["athlete"]
+            performance_records += cls._PERFORMANCE.pack(
+                intern(athlete_data["name"]),
+                intern(athlete_data["gender"]),
+                intern(athlete_data["city"]),
+                intern(athlete_data["state"]),
+                intern(athlete_data["country"]),
+                intern(performance_data["category"]),
+                intern(performance_data["age_group"]),
+                lap_offset,
+                len(lap_column) - lap_offset,
+                sum(lap_column[lap_offset:]),
+            )
+
+        encoded_strings = [value.encode("utf-8") for value in strings]
+        string_offsets = array("I", [0])
+        for encoded in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(encoded))
+        strings_blob = b"".join(encoded_strings)
+        strings_blob += b"\0" * (-len(strings_blob) % 4)
+
+        if sys.byteorder == "big":
+            string_offsets.byteswap()
+            lap_column.byteswap()
+
+        header = cls._HEADER.pack(
+            cls.MAGIC,
+            source_hash[:16].ljust(16, b"\0"),
+            track_data["length_miles"],
+            *metadata_indexes,
+            len(strings),
+            len(strings_blob),
+            len(event_data["performances"]),
+            len(lap_column),
+        )
+        return b"".join(
+            (
+                header,
+                string_offsets.tobytes(),
+                strings_blob,
+                bytes(performance_records),
+                lap_column.tobytes(),
+            )
+        )
+
+    @classmethod
+    def unpack(cls, buffer, laps: bool = True) -> Event:
+        """
+        Rebuild an Event from a snapshot buffer, registering its athletes.
+
+        Args:
+            buffer: Any object supporting the buffer protocol (bytes, mmap...)
+            laps (bool): Whether to load the lap column. When False, every
+                performance is built without laps (lap count and total time
+                only) and the event must be given a ``file_path`` to hydrate them.
+        Returns:
+            Event: The event with all its performances
+        """
+        with memoryview(buffer) as view:
+            return cls._unpack_view(view, laps)
+
+    @classmethod
+    def _unpack_view(cls, view: memoryview, laps: bool) -> Event:
+        (
+            magic,
+            source_hash,
+            length_miles,
+            name_index,
+            date_index,
+            track_name_index,
+            track_city_index,
+            track_country_index,
+            string_count,
+            strings_size,
+            performance_count,
+            lap_count,
+        ) = cls._HEADER.unpack_from(view, 0)
+        if magic != cls.MAGIC:
+            raise ValueError("Not an event snapshot (bad magic)")
+        expected_size = (
+            cls._HEADER.size
+            + (string_count + 1) * 4
+            + strings_size
+            + performance_count * cls._PERFORMANCE.size
+            + lap_count * 4
+        )
+        if len(view) < expected_size:
+            raise ValueError(
+                f"Truncated event snapshot ({len(view)} of {expected_size} bytes)"
+            )
+
+        position = cls._HEADER.size
+        string_offsets = array("I")
+        string_offsets.frombytes(view[position : position + (string_count + 1) * 4])
+        if sys.byteorder == "big":
+            string_offsets.byteswap()
+        position += (string_count + 1) * 4
+        strings_blob = bytes(view[position : position + strings_size])
+        strings = [
+            strings_blob[string_offsets[i] : string_offsets[i + 1]].decode("utf-8")
+            for i in range(string_count)
+        ]
+        position += strings_size
+
+        records_size = performance_count * cls._PERFORMANCE.size
+        records = bytes(view[position : position + records_size])
+        position += records_size
+
+        if laps:
+            lap_column = cls._lap_column_from(view, position, lap_count)
+
+        event = Event(event_params=None)
+        event.name = strings[name_index]
+        event.date = datetime.fromisoformat(strings[date_index])
+        event.track = Track(
+            name=strings[track_name_index],
+            city=strings[track_city_index],
+            country=strings[track_country_index],
+            length_miles=length_miles,
+        )
+        event.source_hash = source_hash.hex()
+
+        # Decode every record before registering any athlete, so that a
+        # corrupt snapshot leaves the AthleteRegistry untouched
+        decoded = []
+        for (
+            athlete_name,
+            gender,
+            city,
+            state,
+            country,
+            category,
+            age_group,
+            lap_offset,
+            laps_in_performance,
+            total_time_ss,
+        ) in cls._PERFORMANCE.iter_unpack(records):
+            if lap_offset + laps_in_performance > lap_count:
+                raise ValueError("Corrupt event snapshot (lap range out of bounds)")
+            try:
+                decoded.append(
+                    (
+                        Athlete(
+                            name=strings[athlete_name],
+                            gender=strings[gender],
+                            city=strings[city],
+                            state=strings[state],
+                            country=strings[country],
+                        ),
+                        strings[category],
+                        strings[age_group],
+                        lap_offset,
+                        laps_in_performance,
+                        total_time_ss,
+                    )
+                )
+            except IndexError:
+                raise ValueError(
+                    "Corrupt event snapshot (string index out of range)"
+                ) from None
+
+        for (
+            athlete,
+            category,
+            age_group,
+            lap_offset,
+            laps_in_performance,
+            total_time_ss,
+        ) in decoded:
+            athlete = AthleteRegistry.get_or_register(athlete, event)
+            if laps:
+                performance = Performance(
+                    athlete=athlete,
+                    laps=lap_column[lap_offset : lap_offset + laps_in_performance],
+                    event=event,
+                    category=category,
+                    age_group=age_group,
+                )
+            else:
+                performance = Performance.without_laps(
+                    athlete=athlete,
+                    event=event,
+                    lap_count=laps_in_performance,
+                    total_time_ss=total_time_ss,
+                    category=category,
+                    age_group=age_group,
+                )
+            event.add_performance(performance, lap_offset=lap_offset)
+        return event
+
+    @classmethod
+    def _lap_column_from(cls, view: memoryview, position: int, lap_count: int) -> array:
+        lap_column = array("I")
+        lap_column.frombytes(view[position : position + lap_count * 4])
+        if sys.byteorder == "big":
+            lap_column.byteswap()
+        return lap_column
+
+    @classmethod
+    def read(cls, snapshot_file: str, laps: bool = True) -> Event:
+        """Memory-map a snapshot file and rebuild its Event."""
+        with open(snapshot_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                event = cls.unpack(mapped, laps=laps)
+        event.file_path = snapshot_file
+        return event
+
+    @classmethod
+    def read_lap_column(cls, snapshot_file: str, source_hash: str) -> array:
+        """
+        Read only the lap column of a snapshot file.
+
+        Args:
+            snapshot_file (str): Path of the snapshot
+            source_hash (str): Expected source digest, guarding against a
+                snapshot recompiled since the event was loaded
+        Returns:
+            array: Every lap time of the event, in snapshot order
+        """
+        with open(snapshot_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    header = cls._HEADER.unpack_from(view, 0)
+                    magic, digest = header[0], header[1]
+                    string_count, strings_size, performance_count, lap_count = header[8:]
+                    if magic != cls.MAGIC or digest.hex() != source_hash:
+                        raise ValueError(
+                            f"Snapshot {snapshot_file} changed since the event was loaded"
+                        )
+                    position = (
+                        cls._HEADER.size
+                        + (string_count + 1) * 4
+                        + strings_size
+                        + performance_count * cls._PERFORMANCE.size
+                    )
+                    return cls._lap_column_from(view, position, lap_count)
+
+    @classmethod
+    def write(cls, snapshot_file: str, snapshot: bytes) -> None:
+        """Atomically write a packed snapshot to disk."""
+        tmp_file = snapshot_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(snapshot)
+        os.replace(tmp_file, snapshot_file)
@@ -1,4 +1,7 @@
 from __future__ import annotations
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
 from typing import TYPE_CHECKING
 
 from models.athlete import Athlete
@@ -11,25 +14,120 @@ if TYPE_CHECKING:
 
 
 class Performance:
-    """Class representing an athlete's performance in an event."""
+    """Class representing an athlete's performance in an event.
+
+    Lap times are stored as a compact ``array('I')`` column of seconds
+    (``lap_times``) rather than one ``LapStats`` object per lap. Lap numbers
+    are implicit (1-indexed position in the column) and ``LapStats`` objects
+    are only materialized on demand through the ``laps`` property.
+
+    Cumulative lap times (prefix sums) are built lazily on first use so that
+    per-lap cumulative queries are O(1) and distance/time lookups are a
+    binary search.
+
+    The lap column can be dropped (``unload_laps``) while the lap count and
+    total time stay known; it is then hydrated again by the event the first
+    time ``lap_times`` is read.
+    """
 
     def __init__(
         self,
         athlete: Athlete,
-        laps: list[LapStats],
+        laps: list[LapStats] | array,
         event: Event,
         category: str = "",
         age_group: str = "",
     ):
         self.athlete = athlete
-        self.laps = laps
         self.category = category
         self.age_group = age_group
         self.event = event
+        self._cumulative_times: array | None = None
+        if isinstance(laps, array):
+            self.set_lap_times(laps)
+        else:
+            self.set_lap_times(array("I", (lap.lap_time_ss for lap in laps)))
         self.total_time_ss = self._total_time_ss()
         self.__set_team()
         self.__set_sport()
 
+    @classmethod
+    def without_laps(
+        cls,
+        athlete: Athlete,
+        event: Event,
+        lap_count: int,
+        total_time_ss: int,
+        category: str = "",
+        age_group: str = "",
+    ) -> Performance:
+        """
+        Build a performance whose lap column is not loaded yet.
+
+        Args:
+            athlete (Athlete): The athlete
+            event (Event): The event, responsible for hydrating the laps later
+            lap_count (int): Number of laps of the performance
+            total_time_ss (int): Total time of the performance in seconds
+            category (str): Category of the performance
+            age_group (str): Age group of the performance
+        Returns:
+            Performance: Performance with its lap column unloaded
+        """
+        performance = cls(
+            athlete=athlete,
+            laps=array("I"),
+            event=event,
+            category=category,
+            age_group=age_group,
+        )
+        performance.unload_laps()
+        performance._lap_count = lap_count
+        performance.total_time_ss = total_time_ss
+        return performance
+
+    @property
+    def lap_times(self) -> array:
+        """
+        Get the lap time column in seconds, hydrating it through the event if needed.
+
+        Returns:
+            array: Lap times in seconds, one per lap
+        """
+        # Read once: another thread may unload the laps at any time
+        lap_times = self._lap_times
+        if lap_times is None:
+            lap_times = self.event.ensure_laps(self)
+        return lap_times
+
+    @property
+    def laps_loaded(self) -> bool:
+        return self._lap_times is not None
+
+    def set_lap_times(self, lap_times: array) -> None:
+        """Replace the lap time column (and invalidate the cumulative index)."""
+        self._lap_times: array | None = lap_times
+        self._lap_count = len(lap_times)
+        self._cumulative_times = None
+
+    def unload_laps(self) -> None:
+        """Drop the lap time column and its cumulative index from memory."""
+        self._lap_times = None
+        self._cumulative_times = None
+
+    @property
+    def laps(self) -> list[LapStats]:
+        """
+        Materialize the lap column as a list of LapStats objects.
+
+        Returns:
+            list[LapStats]: One LapStats per lap, numbered from 1
+        """
+        return [
+            LapStats(lap_number=i, lap_time_ss=lap_time_ss)
+            for i, lap_time_ss in enumerate(self.lap_times, start=1)
+        ]
+
     def __str__(self) -> str:
         return f"{self.athlete.name} - {self.total_miles():.2f} miles - {self.total_laps()} laps - {self.average_speed_kph():.2f} kph - {self.sport} - {self.category} - {self.age_group}"
 
@@ -78,7 +176,77 @@ class Performance:
         Returns:
             int: Total time in seconds
         """
-        return sum(lap.lap_time_ss for lap in self.laps)
+        return sum(self.lap_times)
+
+    def cumulative_times(self) -> array:
+        """
+        Get the cumulative elapsed time at the end of each lap (prefix sums).
+
+        Index ``i`` holds the time in seconds at which lap ``i`` was completed,
+        with index 0 being the start (0 seconds). Built once on first access.
+
+        Returns:
+            array: ``total_laps() + 1`` cumulative times in seconds
+        """
+        if self._cumulative_times is None:
+            self._cumulative_times = array(
+                "I", accumulate(self.lap_times, initial=0)
+            )
+        return self._cumulative_times
+
+    def cumulative_time_ss_at_lap(self, lap_number: int) -> int:
+        """
+        Get the elapsed time in seconds at the end of the specified lap.
+
+        Args:
+            lap_number (int): The lap number (1-indexed)
+        Returns:
+            int: Elapsed time in seconds, or 0 if lap_number is invalid
+        """
+        if lap_number > self.total_laps() or lap_number <= 0:
+            return 0
+        return self.cumulative_times()[lap_number]
+
+    def time_ss_at_miles(self, miles: float) -> int | None:
+        """
+        Get the elapsed time at which the athlete had covered the given distance.
+
+        Timing is only known at the lap line, so this is the end of the first
+        lap whose cumulative distance reaches ``miles``.
+
+        Args:
+            miles (float): Distance in miles
+        Returns:
+            int | None: Elapsed time in seconds, or None if the distance was never reached
+        """
+        if miles <= 0:
+            return 0
+        lap_number = self.event.track.laps_for_miles(miles)
+        if lap_number > self.total_laps():
+            return None
+        return self.cumulative_times()[lap_number]
+
+    def laps_at_time_ss(self, time_ss: int) -> int:
+        """
+        Get the number of laps completed after the given elapsed time.
+
+        Args:
+            time_ss (int): Elapsed time in seconds since the start
+        Returns:
+            int: Number of laps completed at that time
+        """
+        return bisect_right(self.cumulative_times(), time_ss) - 1
+
+    def miles_at_time_ss(self, time_ss: int) -> float:
+        """
+        Get the distance covered in miles after the given elapsed time.
+
+        Args:
+            time_ss (int): Elapsed time in seconds since the start
+        Returns:
+            float: Distance in miles of all laps completed at that time
+        """
+        return self.event.track.length_miles * self.laps_at_time_ss(time_ss)
 
     def total_laps(self) -> int:
         """
@@ -87,7 +255,7 @@ class Performance:
         Returns:
             int: Number of laps
         """
-        return len(self.laps)
+        return self._lap_count
 
     def total_miles(self) -> float:
         """
@@ -199,7 +367,7 @@ class Performance:
         """
         if lap_number > self.total_laps() or lap_number <= 0:
             return 0.0
-        total_time_ss = sum(self.laps[i].lap_time_ss for i in range(lap_number))
+        total_time_ss = self.cumulative_times()[lap_number]
         total_miles = self.event.track.length_miles * lap_number
         return self._calculate_average_speed(total_miles, total_time_ss, "kph")
 
@@ -215,17 +383,22 @@ class Performance:
         """
         if lap_number > self.total_laps() or lap_number <= 0:
             return 0.0
-        lap_time_ss = self.laps[lap_number - 1].lap_time_ss
+        lap_time_ss = self.lap_times[lap_number - 1]
         total_miles = self.event.track.length_miles
         return self._calculate_average_speed(total_miles, lap_time_ss, "kph")
 
-    def to_graph_dict(self) -> dict:
-        """Return ECharts-ready data: cumulative [hours, miles] and [hours, avg_mph] per lap."""
-        cumulative_time_ss = 0
+    def to_graph_dict(self, max_points: int | None = None) -> dict:
+        """Return ECharts-ready data: cumulative [hours, miles] and [hours, avg_mph] per lap.
+
+        Args:
+            max_points (int | None): If set, each series is downsampled to at most
+                this many points with LTTB (shape-preserving).
+        """
+        cumulative_times = self.cumulative_times()
         data: list[list[float]] = [[0, 0]]
         speed_data: list[list[float]] = []
-        for i, lap in enumerate(self.laps, start=1):
-            cumulative_time_ss += lap.lap_time_ss
+        for i in range(1, len(cumulative_times)):
+            cumulative_time_ss = cumulative_times[i]
             hours = round(cumulative_time_ss / 3600, 4)
             miles = round(self.event.track.length_miles * i, 2)
             data.append([hours, miles])
@@ -233,6 +406,9 @@ class Performance:
                 self._calculate_average_speed(miles, cumulative_time_ss, "mph"), 2
             )
             speed_data.append([hours, avg_mph])
+        if max_points is not None:
+            data = Utils.downsample_lttb(data, max_points)
+            speed_data = Utils.downsample_lttb(speed_data, max_points)
         return {
             "athlete": self.athlete.name,
             "sport": self.sport,
@@ -254,8 +430,8 @@ class Performance:
         }
         if laps:
             performance_dic["laps"] = [
-                {"number": lap.lap_number, "time": lap.get_lap_time_hhmmss()}
-                for lap in self.laps
+                {"number": i, "time": Utils.seconds_to_hhmmss(lap_time_ss)}
+                for i, lap_time_ss in enumerate(self.lap_times, start=1)
             ]
         return performance_dic
 
@@ -263,16 +439,11 @@ class Performance:
     def from_dict(cls, performance_data: dict, event: Event) -> Performance:
         raw_athlete = Athlete.from_dict(performance_data["athlete"])
         athlete = AthleteRegistry.get_or_register(raw_athlete, event)
-        laps = []
+        laps = array("I")
         for lap_data in performance_data["laps"]:
             lap_time = Utils.convert_time_str_to_seconds(lap_data["time"])
             if lap_time is not None:
-                laps.append(
-                    LapStats(
-                        lap_number=lap_data["number"],
-                        lap_time_ss=lap_time,
-                    )
-                )
+                laps.append(lap_time)
         return cls(
             athlete=athlete,
             laps=laps,
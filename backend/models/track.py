@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 
 class Track:
     """
@@ -25,6 +27,21 @@ class Track:
     def __str__(self) -> str:
         return f"Track {self.name} ({self.city}, {self.country})"
 
+    def laps_for_miles(self, miles: float) -> int:
+        """
+        Number of laps needed to cover a distance.
+
+        :param miles: Distance in miles
+        :return: The first lap whose cumulative distance reaches ``miles`` (0 for no distance)
+        :raises ValueError: If ``miles`` is not finite
+        """
+        if not math.isfinite(miles):
+            raise ValueError(f"Distance must be finite: {miles}")
+        if miles <= 0:
+            return 0
+        # Round before ceiling to absorb float noise (e.g. 100 / 1.46 * 1.46)
+        return math.ceil(round(miles / self.length_miles, 9))
+
     def to_dict(self) -> dict:
         return {
             "name": self.name,
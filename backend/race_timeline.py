@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Iterator
+
+from event_stats import EventStats, PerformanceSummary
+from models.event import Event
+
+
+class RaceTimeline:
+    """
+    Position timeline of an event, built once from the cumulative lap times of
+    its performances.
+
+    Standing order at a time T: more laps first, then the athlete who completed
+    their last lap earliest (ties by final rank). The lap crossings of every
+    performance are merged (k-way, ``heapq.merge`` over the prefix sums) into
+    one chronological stream, swept once to record:
+
+    - the rank of every performance at each of its lap crossings: everyone who
+      completed that lap before it is ahead, the others are behind;
+    - the lead changes: the leader is whoever first reaches a new lap count;
+    - a checkpoint of the full standing order every ``checkpoint_interval``
+      crossings (one per performance count, so checkpoints take about as much
+      memory as the crossings themselves).
+
+    Standings at any T are then one bisection of the crossings, the order of
+    the checkpoint before it, and the few crossings since, merged in. The
+    leader at T is one bisection of the lead changes. The lap columns are not
+    kept: the cache of timelines is bounded, like the hydrated events.
+    """
+
+    # Maximum number of cached timelines (least recently used evicted)
+    max_cached: int = 4
+    _cache: OrderedDict[Event, RaceTimeline] = OrderedDict()
+
+    def __init__(self, event: Event) -> None:
+        self.event: Event = event
+        self.rows: list[PerformanceSummary] = EventStats.of(event).rows
+        self.length_miles: float = event.track.length_miles
+        self.checkpoint_interval: int = max(len(self.rows), 1)
+        # Every lap crossing of the event, in time order
+        self.crossing_times: array = array("I")
+        self.crossing_indices: array = array("I")
+        self.crossing_laps: array = array("I")
+        # Standing order (rank indices, their laps and last lap times) after
+        # each multiple of ``checkpoint_interval`` crossings
+        self.checkpoints: list[tuple[array, array, array]] = []
+        # Rank of each performance at the end of each of its laps (index 0: lap 1)
+        self.lap_ranks: list[array] = [array("I") for _ in self.rows]
+        self.lead_change_times: array = array("I")
+        self.lead_change_leaders: array = array("I")
+        self.lead_change_laps: array = array("I")
+        self.__sweep()
+        self.duration_ss: int = self.crossing_times[-1] if self.crossing_times else 0
+
+    @classmethod
+    def of(cls, event: Event) -> RaceTimeline:
+        """Return the cached timeline of an event, rebuilt if performances were added."""
+        timeline = cls._cache.get(event)
+        if timeline is None or len(timeline.rows) != len(event.performances):
+            timeline = cls._cache[event] = cls(event)
+        cls._cache.move_to_end(event)
+        while len(cls._cache) > max(cls.max_cached, 1):
+            cls._cache.popitem(last=False)
+        return timeline
+
+    @staticmethod
+    def __crossings(
+        index: int, cumulative_times: array
+    ) -> Iterator[tuple[int, int, int]]:
+        for lap in range(1, len(cumulative_times)):
+            yield cumulative_times[lap], index, lap
+
+    def __checkpoint(self, laps: list[int], last_lap_times: list[int]) -> None:
+        order = sorted(
+            range(len(self.rows)), key=lambda index: (-laps[index], last_lap_times[index])
+        )
+        self.checkpoints.append(
+            (
+                array("I", order),
+                array("I", (laps[index] for index in order)),
+                array("I", (last_lap_times[index] for index in order)),
+            )
+        )
+
+    def __sweep(self) -> None:
+        # Laps and last lap time of each performance so far
+        laps = [0] * len(self.rows)
+        last_lap_times = [0] * len(self.rows)
+        # Number of performances having completed each lap so far
+        lap_counts: list[int] = []
+        leader: int | None = None
+        crossings = heapq.merge(
+            *(
+                self.__crossings(index, row.performance.cumulative_times())
+                for index, row in enumerate(self.rows)
+            )
+        )
+        for crossing, (time_ss, index, lap) in enumerate(crossings):
+            if crossing % self.checkpoint_interval == 0:
+                self.__checkpoint(laps, last_lap_times)
+            self.crossing_times.append(time_ss)
+            self.crossing_indices.append(index)
+            self.crossing_laps.append(lap)
+            laps[index] = lap
+            last_lap_times[index] = time_ss
+            if lap > len(lap_counts):
+                lap_counts.append(0)
+                if index != leader:
+                    leader = index
+                    self.lead_change_times.append(time_ss)
+                    self.lead_change_leaders.append(index)
+                    self.lead_change_laps.append(lap)
+            lap_counts[lap - 1] += 1
+            self.lap_ranks[index].append(lap_counts[lap - 1])
+        if not self.checkpoints:
+            self.__checkpoint(laps, last_lap_times)
+
+    def index_of(self, canonical_name: str) -> int | None:
+        for index, row in enumerate(self.rows):
+            if row.performance.athlete.canonical_name == canonical_name:
+                return index
+        return None
+
+    def standings(self, time_ss: int) -> list[dict]:
+        """
+        Standings of the event at an elapsed time.
+
+        Args:
+            time_ss (int): Elapsed time in seconds since the start
+        Returns:
+            list[dict]: One entry per performance in position order, with its
+                laps, miles, gap to the leader and time of its last lap
+        """
+        crossed = bisect_right(self.crossing_times, time_ss)
+        checkpoint = min(crossed // self.checkpoint_interval, len(self.checkpoints) - 1)
+        order, order_laps, order_times = self.checkpoints[checkpoint]
+        # Latest crossing of each performance that moved since the checkpoint
+        moved: dict[int, tuple[int, int]] = {}
+        for crossing in range(checkpoint * self.checkpoint_interval, crossed):
+            moved[self.crossing_indices[crossing]] = (
+                -self.crossing_laps[crossing],
+                self.crossing_times[crossing],
+            )
+        # The others keep their (sorted) checkpoint order: merge the two
+        entries = list(
+            heapq.merge(
+                (
+                    (-laps, last_lap_time_ss, index)
+                    for index, laps, last_lap_time_ss in zip(
+                        order, order_laps, order_times
+                    )
+                    if index not in moved
+                ),
+                sorted((*key, index) for index, key in moved.items()),
+            )
+        )
+
+        leader_laps = -entries[0][0] if entries else 0
+        standings = []
+        for position, (negative_laps, last_lap_time_ss, index) in enumerate(
+            entries, start=1
+        ):
+            row = self.rows[index]
+            laps = -negative_laps
+            standings.append(
+                {
+                    "position": position,
+                    "final_rank": row.rank,
+                    "athlete": row.performance.athlete.name,
+                    "sport": row.sport,
+                    "laps": laps,
+                    "miles": round(laps * self.length_miles, 2),
+                    "gap_laps": leader_laps - laps,
+                    "last_lap_time_ss": last_lap_time_ss,
+                }
+            )
+        return standings
+
+    def leader_at(self, time_ss: int) -> PerformanceSummary | None:
+        """Leader at an elapsed time (None before the first lap is completed)."""
+        change = bisect_right(self.lead_change_times, time_ss) - 1
+        if change < 0:
+            return None
+        return self.rows[self.lead_change_leaders[change]]
+
+    def lead_changes(self) -> list[dict]:
+        """Every change of leader, in time order (the first lap included)."""
+        return [
+            {
+                "time_ss": time_ss,
+                "lap": lap,
+                "athlete": self.rows[index].performance.athlete.name,
+                "final_rank": self.rows[index].rank,
+            }
+            for time_ss, index, lap in zip(
+                self.lead_change_times, self.lead_change_leaders, self.lead_change_laps
+            )
+        ]
+
+    def rank_history(self, index: int) -> dict:
+        """
+        Position of a performance at the end of each of its laps.
+
+        Returns:
+            dict: The athlete, and lap-aligned ``time_ss`` / ``position`` columns
+        """
+        row = self.rows[index]
+        return {
+            "athlete": row.performance.athlete.name,
+            "final_rank": row.rank,
+            "time_ss": row.performance.cumulative_times()[1:].tolist(),
+            "position": self.lap_ranks[index].tolist(),
+        }
@@ -1,32 +1,15 @@
+import asyncio
 import os
 from webscraper.event_scraper import EventScraper
 from webscraper.browser_manager import BrowserManager
+from webscraper.scrape_journal import ScrapeJournal
 from event_params_data import miami_event_params
 from models.event import Event
 from event_stats import EventStats
 
 
 def scrape_events():
-    BrowserManager.start()
-
-    try:
-        events = [
-            # EventScraper.scrape(miami_event_params[2013]),
-            # EventScraper.scrape(miami_event_params[2014]),
-            # EventScraper.scrape(miami_event_params[2015]),
-            # EventScraper.scrape(miami_event_params[2016]),
-            # EventScraper.scrape(miami_event_params[2017]),
-            # EventScraper.scrape(miami_event_params[2018]),
-            # EventScraper.scrape(miami_event_params[2019]),
-            # EventScraper.scrape(miami_event_params[2020]),
-            # EventScraper.scrape(miami_event_params[2021]),
-            # EventScraper.scrape(miami_event_params[2022]),
-            # EventScraper.scrape(miami_event_params[2023]),
-            # EventScraper.scrape(miami_event_params[2024]),
-            # EventScraper.scrape(miami_event_params[2025]),
-        ]
-    finally:
-        BrowserManager.shutdown()
+    events = asyncio.run(scrape_events_async())
 
     for event in events:
         if event is None or len(event.performances) == 0:
@@ -35,3 +18,30 @@ def scrape_events():
         event.to_json_file(
             os.path.join("ultraskate_miami_" + str(event.date.year) + ".json")
         )
+        # Saved: a new scrape of this event starts from scratch
+        ScrapeJournal.discard(event)
+
+
+async def scrape_events_async(page_pool_size: int = 4) -> list[Event | None]:
+    # Pages of each event are fetched concurrently, up to page_pool_size at a time
+    await BrowserManager.start_async(page_pool_size)
+
+    try:
+        events = [
+            # await EventScraper.scrape_async(miami_event_params[2013]),
+            # await EventScraper.scrape_async(miami_event_params[2014]),
+            # await EventScraper.scrape_async(miami_event_params[2015]),
+            # await EventScraper.scrape_async(miami_event_params[2016]),
+            # await EventScraper.scrape_async(miami_event_params[2017]),
+            # await EventScraper.scrape_async(miami_event_params[2018]),
+            # await EventScraper.scrape_async(miami_event_params[2019]),
+            # await EventScraper.scrape_async(miami_event_params[2020]),
+            # await EventScraper.scrape_async(miami_event_params[2021]),
+            # await EventScraper.scrape_async(miami_event_params[2022]),
+            # await EventScraper.scrape_async(miami_event_params[2023]),
+            # await EventScraper.scrape_async(miami_event_params[2024]),
+            # await EventScraper.scrape_async(miami_event_params[2025]),
+        ]
+    finally:
+        await BrowserManager.shutdown_async()
+    return events
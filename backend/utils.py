@@ -102,3 +102,53 @@ class Utils:
         if match:
             return match.group(0)
         return None
+
+    @classmethod
+    def downsample_lttb(
+        cls, points: list[list[float]], max_points: int
+    ) -> list[list[float]]:
+        """
+        Downsamples a series of [x, y] points with the Largest-Triangle-Three-Buckets
+        algorithm, which keeps the visual shape of the series (peaks, dips, slope
+        changes) with a fixed number of points. The first and last points are kept.
+
+        Args:
+            points (list[list[float]]): Points sorted by x.
+            max_points (int): Maximum number of points to return (at least 3).
+
+        Returns:
+            list[list[float]]: The downsampled points, or the input if already small enough.
+        """
+        n = len(points)
+        if max_points < 3 or n <= max_points:
+            return points
+
+        sampled = [points[0]]
+        bucket_size = (n - 2) / (max_points - 2)
+        previous = 0
+        for bucket in range(max_points - 2):
+            # Average of the next bucket, used as the third vertex of the triangle
+            next_start = int((bucket + 1) * bucket_size) + 1
+            next_end = min(int((bucket + 2) * bucket_size) + 1, n)
+            next_count = next_end - next_start
+            avg_x = sum(points[i][0] for i in range(next_start, next_end)) / next_count
+            avg_y = sum(points[i][1] for i in range(next_start, next_end)) / next_count
+
+            # Keep the point of the current bucket forming the largest triangle
+            prev_x, prev_y = points[previous]
+            start = int(bucket * bucket_size) + 1
+            end = int((bucket + 1) * bucket_size) + 1
+            best_area = -1.0
+            best = start
+            for i in range(start, end):
+                x, y = points[i]
+                area = abs(
+                    (prev_x - avg_x) * (y - prev_y) - (prev_x - x) * (avg_y - prev_y)
+                )
+                if area > best_area:
+                    best_area = area
+                    best = i
+            sampled.append(points[best])
+            previous = best
+        sampled.append(points[-1])
+        return sampled
@@ -1,26 +1,54 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Any
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+from typing import Any, AsyncIterator, Iterator
+from playwright.sync_api import (
+    sync_playwright,
+    APIRequestContext,
+    Browser,
+    BrowserContext,
+    Page,
+    Route,
+)
+from playwright.async_api import (
+    async_playwright,
+    APIRequestContext as AsyncAPIRequestContext,
+    Browser as AsyncBrowser,
+    BrowserContext as AsyncBrowserContext,
+    Page as AsyncPage,
+    Playwright as AsyncPlaywright,
+    Route as AsyncRoute,
+)
 
 
 class BrowserManager:
     _playwright = None
     _browser: Browser | None = None
     _context: BrowserContext | None = None
+    # Idle pages of the sync context, reused instead of opening one per URL
+    _idle_pages: list[Page] = []
 
-    _storage_state_path = Path("browser_state.json")
+    # Async variant: one context shared by a bounded pool of pages
+    page_pool_size: int = 4
+    _async_playwright: AsyncPlaywright | None = None
+    _async_browser: AsyncBrowser | None = None
+    _async_context: AsyncBrowserContext | None = None
+    _async_idle_pages: asyncio.Queue[AsyncPage] | None = None
+    _async_page_count: int = 0
+    # Bounds plain HTTP requests of the async context like the page pool does
+    # navigations: at most page_pool_size requests in flight
+    _async_requests: asyncio.Semaphore | None = None
 
-    @classmethod
-    def start(cls) -> None:
-        if cls._browser is not None:
-            return
+    # Only the DOM is read: requests of other resource types (images, fonts,
+    # stylesheets, scripts...) are aborted unless block_resources is False
+    block_resources: bool = True
+    allowed_resource_types: set[str] = {"document"}
 
-        cls._playwright = sync_playwright().start()
-        cls._browser = cls._playwright.chromium.launch(
-            headless=True,
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+    _storage_state_path = Path("browser_state.json")
+    _launch_args = ["--disable-blink-features=AutomationControlled"]
 
+    @classmethod
+    def _context_kwargs(cls) -> dict[str, Any]:
         context_kwargs: dict[str, Any] = {
             "user_agent": (
                 "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -32,8 +60,21 @@ class BrowserManager:
 
         if cls._storage_state_path.exists():
             context_kwargs["storage_state"] = str(cls._storage_state_path)
+        return context_kwargs
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._browser is not None:
+            return
 
-        cls._context = cls._browser.new_context(**context_kwargs)
+        cls._playwright = sync_playwright().start()
+        cls._browser = cls._playwright.chromium.launch(
+            headless=True,
+            args=cls._launch_args,
+        )
+        cls._context = cls._browser.new_context(**cls._context_kwargs())
+        if cls.block_resources:
+            cls._context.route("**/*", cls._route)
 
     @classmethod
     def new_page(cls) -> Page:
@@ -41,6 +82,31 @@ class BrowserManager:
             raise RuntimeError("BrowserManager not started")
         return cls._context.new_page()
 
+    @classmethod
+    def request_context(cls) -> APIRequestContext:
+        """HTTP client of the sync context, sharing its cookies (no rendering)."""
+        if cls._context is None:
+            raise RuntimeError("BrowserManager not started")
+        return cls._context.request
+
+    @classmethod
+    def _route(cls, route: Route) -> None:
+        if route.request.resource_type in cls.allowed_resource_types:
+            route.continue_()
+        else:
+            route.abort()
+
+    @classmethod
+    @contextmanager
+    def page(cls) -> Iterator[Page]:
+        """Borrow an idle page of the sync context (a new one if none is idle)."""
+        page = cls._idle_pages.pop() if cls._idle_pages else cls.new_page()
+        try:
+            yield page
+        finally:
+            if not page.is_closed():
+                cls._idle_pages.append(page)
+
     @classmethod
     def shutdown(cls) -> None:
         # ✅ SAVE COOKIES ON SHUTDOWN
@@ -57,3 +123,98 @@ class BrowserManager:
         cls._browser = None
         cls._context = None
         cls._playwright = None
+        cls._idle_pages = []
+
+    @classmethod
+    async def start_async(cls, page_pool_size: int | None = None) -> None:
+        """
+        Start the async browser, whose pages are shared through a bounded pool.
+
+        Args:
+            page_pool_size (int | None): Maximum number of open pages, hence of
+                concurrent navigations, and of concurrent plain requests
+                (default: cls.page_pool_size)
+        """
+        if cls._async_browser is not None:
+            return
+        if page_pool_size is not None:
+            cls.page_pool_size = page_pool_size
+
+        cls._async_playwright = await async_playwright().start()
+        cls._async_browser = await cls._async_playwright.chromium.launch(
+            headless=True,
+            args=cls._launch_args,
+        )
+        cls._async_context = await cls._async_browser.new_context(
+            **cls._context_kwargs()
+        )
+        if cls.block_resources:
+            await cls._async_context.route("**/*", cls._async_route)
+        cls._async_idle_pages = asyncio.Queue()
+        cls._async_page_count = 0
+        cls._async_requests = asyncio.Semaphore(cls.page_pool_size)
+
+    @classmethod
+    @asynccontextmanager
+    async def async_request(cls) -> AsyncIterator[AsyncAPIRequestContext]:
+        """
+        Borrow the HTTP client of the async context (sharing its cookies, no
+        rendering), waiting while ``page_pool_size`` requests are in flight.
+        """
+        if cls._async_context is None or cls._async_requests is None:
+            raise RuntimeError("BrowserManager async browser not started")
+        async with cls._async_requests:
+            yield cls._async_context.request
+
+    @classmethod
+    async def _async_route(cls, route: AsyncRoute) -> None:
+        if route.request.resource_type in cls.allowed_resource_types:
+            await route.continue_()
+        else:
+            await route.abort()
+
+    @classmethod
+    @asynccontextmanager
+    async def async_page(cls) -> AsyncIterator[AsyncPage]:
+        """
+        Borrow a page of the async pool, waiting while ``page_pool_size`` pages
+        are already in use.
+        """
+        if cls._async_context is None or cls._async_idle_pages is None:
+            raise RuntimeError("BrowserManager async browser not started")
+        idle_pages = cls._async_idle_pages
+
+        if idle_pages.empty() and cls._async_page_count < cls.page_pool_size:
+            cls._async_page_count += 1
+            try:
+                page = await cls._async_context.new_page()
+            except BaseException:
+                cls._async_page_count -= 1
+                raise
+        else:
+            page = await idle_pages.get()
+            if page.is_closed():
+                page = await cls._async_context.new_page()
+        try:
+            yield page
+        finally:
+            idle_pages.put_nowait(page)
+
+    @classmethod
+    async def shutdown_async(cls) -> None:
+        if cls._async_context:
+            await cls._async_context.storage_state(path=str(cls._storage_state_path))
+            await cls._async_context.close()
+
+        if cls._async_browser:
+            await cls._async_browser.close()
+
+        if cls._async_playwright:
+            await cls._async_playwright.stop()
+
+        cls._async_browser = None
+        cls._async_context = None
+        cls._async_playwright = None
+        cls._async_idle_pages = None
+        cls._async_page_count = 0
+        cls._async_requests = None
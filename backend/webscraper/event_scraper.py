@@ -1,15 +1,22 @@
-import pprint
+import asyncio
+import hashlib
+import json
 import re
-import requests
+from functools import partial
 from bs4 import BeautifulSoup
 
-from models.lap_stats import LapStats
 from models.event import Event
-from models.athlete import Athlete
-from models.performance import Performance
 from models.athlete_registry import AthleteRegistry
 from models.event_params import EventParams
 from webscraper.webscraper import Webscraper
+from webscraper.http_client import HttpClient
+from webscraper.http_cache import HttpCache
+from webscraper.scrape_journal import ScrapeJournal
+from webscraper.scrape_pipeline import ScrapePipeline
+from webscraper.browser_manager import BrowserManager
+from webscraper.myraceresult_parser import MyRaceResultParser
+from webscraper.jms_parser import JmsParser
+from webscraper.performance_record import PerformanceRecord
 from webscraper.jms_site_params import JmsSiteParams
 from webscraper.myraceresult_params import MyRaceResultParams
 from utils import Utils
@@ -34,43 +41,112 @@ class EventScraper:
             )
             return None
 
+    @classmethod
+    async def scrape_async(
+        cls, event_params: EventParams, concurrency: int | None = None
+    ) -> Event | None:
+        """
+        Scrape an event fetching its pages concurrently.
+
+        JMS events need the async browser (BrowserManager.start_async), whose
+        page pool bounds their concurrency. MyRaceResult events go through
+        HttpClient, bounded by ``concurrency``.
+        """
+        if isinstance(event_params.scraped_site_params, JmsSiteParams):
+            print(f"Scraping JMS site for event on {event_params.date}...")
+            return await cls.scrape_jms_async(event_params)
+        elif isinstance(event_params.scraped_site_params, MyRaceResultParams):
+            print(f"Scraping MyRaceResult site for event on {event_params.date}...")
+            return await cls.scrape_myraceresult_async(event_params, concurrency)
+        else:
+            print(
+                f"Scraping site for event on {event_params.date} not implemented yet."
+            )
+            return None
+
     @classmethod
     def __scrape_myraceresult_event(cls, event_params: EventParams) -> Event:
+        return asyncio.run(cls.scrape_myraceresult_async(event_params))
+
+    @classmethod
+    async def scrape_myraceresult_async(
+        cls, event_params: EventParams, concurrency: int | None = None
+    ) -> Event:
+        """
+        Scrape a MyRaceResult event, fetching the lap details of the participants
+        concurrently through the shared HttpClient.
+
+        Args:
+            event_params (EventParams): Parameters of the event
+            concurrency (int | None): Maximum requests in flight (default: HttpClient.concurrency)
+        Returns:
+            Event: The scraped event, performances in participants list order
+        """
         event = Event(event_params)
+        if not isinstance(event_params.scraped_site_params, MyRaceResultParams):
+            print(
+                "EventScraper: Invalid scraped site params for MyRaceResult event scraping."
+            )
+            return event
+        site_params = event_params.scraped_site_params
+        # Results of past events are final: their responses are cached forever
+        immutable = HttpCache.is_settled(event_params.date)
 
         # Fetch participants JSON data
-        participants_json = cls.fetch_particpants_json(event_params)
+        print(f"Participants URL: {site_params.ranking_home_url}")
+        participants_json = await HttpClient.fetch_json(
+            site_params.ranking_home_url, immutable=immutable
+        )
         if not participants_json:
             print(
                 f"Could not fetch participants JSON data for event on {event_params.date}."
             )
             return event
 
-        no_laps_performances = 0  # DEBUG
-
-        keys = [1, 2]
-        for key in keys:
-            try:
-                participants_data = participants_json["data"][f"#{key}_Individual"]
-                break
-            except KeyError:
-                continue
-        else:
+        participants_data = MyRaceResultParser.participants_rows(participants_json)
+        if participants_data is None:
             print("Could not find participants data in JSON.")
             return event
 
-        # participants_data: list[list[str]] = participants_json["data"]["#1_Individual"]
-        for participant in participants_data:
+        no_laps_performances = 0  # DEBUG
+
+        # Records arrive in participants order, whatever the order in which
+        # the responses arrived, so that the event is the same as when scraped
+        # sequentially
+        def add_performance(record: dict | None) -> None:
+            nonlocal no_laps_performances
+            if record:
+                event.add_performance(PerformanceRecord.to_performance(record, event))
+            else:
+                no_laps_performances += 1
+
+        async def fetch_laps_json(participant: list[str]) -> dict | None:
             print(
                 f"ID : {participant[1]} / Name : {participant[3]} / Discipline : {participant[7]} / Age category : {participant[6]}"
             )
-            performance = cls.__fetch_participant_performance(
-                participant=participant, event=event, event_params=event_params
+            return await HttpClient.fetch_json(
+                f"{site_params.athlete_url}{participant[1]}", immutable=immutable
+            )
+
+        with ScrapeJournal(event) as journal:
+            pipeline = ScrapePipeline(
+                fetch=fetch_laps_json,
+                parse=partial(
+                    MyRaceResultParser.participant_record, site_params=site_params
+                ),
+                consume=add_performance,
+                journal=journal,
+                fetchers=concurrency or HttpClient.concurrency,
+                # Lap details JSON is already decoded and cheap to parse:
+                # shipping it to other processes would cost more
+                parse_workers=0,
+            )
+            await pipeline.run(
+                [
+                    (cls.__participant_key(participant), participant)
+                    for participant in participants_data
+                ]
             )
-            if performance:
-                event.add_performance(performance)
-            else:
-                no_laps_performances += 1
         print(
             f"\nNumber of participants found for {event_params.date.year}: {len(participants_data)}"
         )
@@ -79,134 +155,118 @@ class EventScraper:
         return event
 
     @classmethod
-    def __format_myraceresult_name(cls, name: str) -> str:
+    def __participant_key(cls, participant: list[str]) -> str:
         """
-        Format a MyRaceResult participant name to "Last, First" format to "First Last"
-        Args:
-            name (str): Name string from MyRaceResult participant data
-        Returns:
-            str: Formatted name string
+        Journal key of a MyRaceResult participant: its id and a digest of its
+        row, so that a participant whose row changed is fetched again.
         """
-        name_parts = name.split(", ")
-        if len(name_parts) == 2:
-            formatted_name = f"{name_parts[1]} {name_parts[0]}"
-            return formatted_name
-        return name
+        row_digest = hashlib.sha1(json.dumps(participant).encode("utf-8")).hexdigest()
+        return f"{participant[1]}:{row_digest}"
 
     @classmethod
-    def __fetch_participant_performance(
-        cls, participant: list[str], event: Event, event_params: EventParams
-    ) -> Performance | None:
-        if not isinstance(event_params.scraped_site_params, MyRaceResultParams):
-            print(
-                "EventScraper: Unsupported scraped site params for fetching participant performance."
+    def __scrape_jms_event(cls, event_params: EventParams) -> Event:
+        event = Event(event_params)
+        if not isinstance(event_params.scraped_site_params, JmsSiteParams):
+            print("EventScraper: Invalid scraped site params for JMS event scraping.")
+            return event
+
+        athletes_urls: list[str] = []
+        for athlete_performance_url in cls.__categories_ranking_urls(
+            event_params.scraped_site_params
+        ):
+            print(f"Fetching athlete performance URLs from: {athlete_performance_url}")
+            athletes_urls.extend(
+                cls.__fetch_all_athlete_performance_urls(
+                    athlete_performance_url, event_params
+                )
             )
-            return None
 
-        participant_id: str = participant[1]
-        participant_name: str = cls.__format_myraceresult_name(participant[3])
-        participant_age_category: str = participant[
-            event_params.scraped_site_params.age_group_col_index
-        ]
-        participant_discipline: str = participant[
-            event_params.scraped_site_params.category_col_index
-        ]
-        participant_gender: str = participant[
-            event_params.scraped_site_params.gender_col_index
-        ]
-        if participant_gender == "Open":
-            participant_gender = "Male"
-        participant_url = (
-            f"{event_params.scraped_site_params.athlete_url}{participant_id}"
-        )
+        # Fetch all athlete performance URLs from the event ranking page
+        # athletes_urls = cls.__fetch_all_athlete_performance_urls(event_params)
 
-        print(participant_url)
+        print(
+            f"\nNumber of athlete URLs found for {event_params.date.year}: {len(athletes_urls)}"
+        )
 
-        response = requests.get(participant_url)
-        if response.status_code != 200:
-            print(
-                f"Failed to fetch participant JSON data. Status code: {response.status_code}"
-            )
-            return None
+        with ScrapeJournal(event) as journal:
+            for athlete_url in athletes_urls:
+                if athlete_url in journal:
+                    record = journal.get(athlete_url)
+                else:
+                    try:
+                        record = cls.__get_record_from_athlete_url(
+                            athlete_url=athlete_url, event=event
+                        )
+                    except ValueError as error:
+                        # Not journaled: fetched again by the next run
+                        print(f"Parsing {athlete_url} failed: {error!r}")
+                        continue
+                    # Journaled even without laps, so a resume skips it
+                    journal.record(athlete_url, record)
+                if record:
+                    event.add_performance(PerformanceRecord.to_performance(record, event))
 
-        # pprint.pp(response.json())
-
-        laps_data = response.json()["data"]
-        all_laps_stats: list[LapStats] = []
-        for lap_index, lap_data in enumerate(laps_data):
-            lap_time = lap_data[4][:-3]
-            if len(lap_time) == 5:
-                lap_time_formatted = "00:" + str(lap_time)
-            elif len(lap_time) == 7:
-                lap_time_formatted = "0" + str(lap_time)
-            elif len(lap_time) >= 8:
-                lap_time_formatted = str(lap_time)
-
-            lap_time_seconds = Utils.convert_time_str_to_seconds(
-                lap_time_formatted
-            )  # pyright: ignore[reportPossiblyUnboundVariable]
-            if lap_time_seconds is None:
-                print(
-                    f"Could not convert lap time for lap {lap_index + 1}: {lap_time_formatted}"  # pyright: ignore[reportPossiblyUnboundVariable]
-                )
-                continue
-            lap_stats = LapStats(lap_number=lap_index + 1, lap_time_ss=lap_time_seconds)
-            all_laps_stats.append(lap_stats)
-
-        athlete = Athlete(
-            name=participant_name, gender=participant_gender
-        )  # pyright: ignore[reportArgumentType]
-        athlete = AthleteRegistry.get_or_register(athlete)
-
-        athlete_performance = Performance(
-            athlete=athlete,
-            age_group=participant_age_category,
-            category=participant_discipline,
-            laps=all_laps_stats,
-            event=event,
+        print(
+            f"Total athletes in registry: {len(AthleteRegistry.athletes)}/ {len(athletes_urls)}\n"
         )
-        # If there are no lap values, skip this participant
-        if athlete_performance.total_laps() == 0:
-            print(f"No laps found for participant {participant_name}")
-            return None
 
-        return athlete_performance
-        # https://my4.raceresult.com/192607/RRPublish/data/list?key=9d484a9a9259ff0ae1a4a8570861bc3b&listname=Online%7CLap%20Details&page=live&contest=0&r=pid&pid=421
+        return event
 
     @classmethod
-    def __scrape_jms_event(cls, event_params: EventParams) -> Event:
+    async def scrape_jms_async(cls, event_params: EventParams) -> Event:
+        """
+        Scrape a JMS event, fetching the ranking pages then the athlete pages
+        concurrently through the page pool of BrowserManager.
+
+        Args:
+            event_params (EventParams): Parameters of the event
+        Returns:
+            Event: The scraped event, performances in ranking order
+        """
         event = Event(event_params)
         if not isinstance(event_params.scraped_site_params, JmsSiteParams):
             print("EventScraper: Invalid scraped site params for JMS event scraping.")
             return event
 
         athletes_urls: list[str] = []
-        for category_index in event_params.scraped_site_params.categories_indexes:
-            print(f"Scraping category index: {category_index}")
-            athlete_performance_url = (
-                event_params.scraped_site_params.ranking_home_url
-                + f"&EId={category_index}&dt=0&adv=1"
-            )
-            print(f"Fetching athlete performance URLs from: {athlete_performance_url}")
-            athletes_urls.extend(
-                cls.__fetch_all_athlete_performance_urls(
-                    athlete_performance_url, event_params
+        for category_athletes_urls in await asyncio.gather(
+            *(
+                cls.__fetch_all_athlete_performance_urls_async(
+                    ranking_url, event_params
+                )
+                for ranking_url in cls.__categories_ranking_urls(
+                    event_params.scraped_site_params
                 )
             )
-
-        # Fetch all athlete performance URLs from the event ranking page
-        # athletes_urls = cls.__fetch_all_athlete_performance_urls(event_params)
+        ):
+            athletes_urls.extend(category_athletes_urls)
 
         print(
             f"\nNumber of athlete URLs found for {event_params.date.year}: {len(athletes_urls)}"
         )
 
-        for athlete_url in athletes_urls:
-            performance = cls.__get_performance_from_athlete_url(
-                athlete_url=athlete_url, event=event
+        immutable = HttpCache.is_settled(event_params.date)
+
+        # Records arrive in ranking order so that athletes are registered as
+        # when scraped sequentially
+        def add_performance(record: dict | None) -> None:
+            if record:
+                event.add_performance(PerformanceRecord.to_performance(record, event))
+
+        async def fetch_athlete_page(athlete_url: str) -> str:
+            return await Webscraper.fetch_text_async(athlete_url, immutable)
+
+        with ScrapeJournal(event) as journal:
+            pipeline = ScrapePipeline(
+                fetch=fetch_athlete_page,
+                parse=JmsParser.athlete_record,
+                consume=add_performance,
+                journal=journal,
+                fetchers=BrowserManager.page_pool_size,
+            )
+            await pipeline.run(
+                [(athlete_url, athlete_url) for athlete_url in athletes_urls]
             )
-            if performance:
-                event.add_performance(performance)
 
         print(
             f"Total athletes in registry: {len(AthleteRegistry.athletes)}/ {len(athletes_urls)}\n"
@@ -214,6 +274,16 @@ class EventScraper:
 
         return event
 
+    @classmethod
+    def __categories_ranking_urls(cls, site_params: JmsSiteParams) -> list[str]:
+        """
+        Build the "advanced view" ranking URL of each category of a JMS event.
+        """
+        return [
+            site_params.ranking_home_url + f"&EId={category_index}&dt=0&adv=1"
+            for category_index in site_params.categories_indexes
+        ]
+
     @classmethod
     def fetch_particpants_json(cls, event_params: EventParams) -> dict | None:
         """
@@ -230,144 +300,32 @@ class EventScraper:
             )
             return None
         print(f"Participants URL: {event_params.scraped_site_params.ranking_home_url}")
-        response = requests.get(event_params.scraped_site_params.ranking_home_url)
-
-        pprint.pp(response.json())
-
-        # If the request was successful, parse and return the JSON data
-        if response.status_code != 200:
-            print(
-                f"Failed to fetch participants JSON data. Status code: {response.status_code}"
-            )
-            return None
-
-        return response.json()
+        # Decoded once, and only when the request succeeded
+        return HttpClient.get_json(
+            event_params.scraped_site_params.ranking_home_url,
+            immutable=HttpCache.is_settled(event_params.date),
+        )
 
         # https://my4.raceresult.com/192607/RRPublish/data/list?key=9d484a9a9259ff0ae1a4a8570861bc3b&listname=Participants%7CParticipants%20List%20123&page=participants&contest=0&r=all&l=0
 
     @classmethod
-    def __get_performance_from_athlete_url(
+    def __get_record_from_athlete_url(
         cls, athlete_url: str, event: Event
-    ) -> Performance | None:
+    ) -> dict | None:
         """
-        From an athlete URL, scrape the athlete info and performance data and return a Performance object
+        From an athlete URL, scrape the athlete info and performance data and return a performance record
         Args:
             athlete_url (str): URL of the athlete's performance page
-            event_params (EventParams): Parameters of the event
+            event (Event): Event being scraped
         Returns:
-            Performance | None: Performance object containing athlete info and performance data, or None if scraping fails
+            dict | None: Performance record containing athlete info and performance data, or None if the athlete has no laps
+        Raises:
+            ValueError: If the fetched page is not an athlete page
         """
-        athlete_performance_soup = Webscraper.fetch_html(athlete_url)
-        if not athlete_performance_soup:
-            print(f"athlete_performance_soup is empty for URL: {athlete_url}")
-        athlete_info = athlete_performance_soup.find(
-            name="div", id="ctl00_Content_Main_divLeft"
-        )
-        # print(f"\nScraping athlete page: {athlete_url}")
-
-        if not athlete_info:
-            print(f"Could not find athlete info on page: {athlete_url}")
-            print(athlete_performance_soup)
-            return None
-
-        athlete_name = ""
-        athlete_gender = ""
-        athlete_city = ""
-        athlete_state = ""
-        athlete_country = ""
-        performance_age_group = ""
-        performance_category = ""
-
-        # Get athlete name from the specific span
-        athlete_name_span = athlete_info.find(
-            name="span", id="ctl00_Content_Main_lblName"
-        )
-        performance_category_span = athlete_info.find(
-            name="span", id="ctl00_Content_Main_lblEvent"
-        )
-        if not athlete_name_span or not performance_category_span:
-            return None
-        athlete_name = athlete_name_span.text.strip()
-        performance_category = performance_category_span.text.strip()
-
-        # Get other athlete info from the table rows
-        athlete_info_rows = athlete_info.find_all("tr")
-
-        for row in athlete_info_rows:
-            athlete_row_tds = row.find_all("td")
-            if len(athlete_row_tds) < 2:
-                continue
-            label = athlete_row_tds[0].text.strip().lower()
-            value = athlete_row_tds[1].text.strip()
-
-            if "gender" in label:
-                # print(f"Found athlete gender: {value}")
-                athlete_gender = value
-            elif "city" in label:
-                # print(f"Found athlete city: {value}")
-                athlete_city = value
-            elif "state" in label:
-                # print(f"Found athlete state: {value}")
-                athlete_state = value
-            elif "country" in label:
-                # print(f"Found athlete country: {value}")
-                athlete_country = value
-            elif "category" in label and label != "secondary category :":
-                performance_category = value
-
-        athlete_laps_table = athlete_performance_soup.find(
-            name="div", id="ctl00_Content_Main_divSplitGrid"
+        html = Webscraper.fetch_text(
+            athlete_url, immutable=HttpCache.is_settled(event.date)
         )
-        if not athlete_laps_table:
-            print(f"No laps table found for athlete: {athlete_name} at {athlete_url}")
-            return None
-
-        lap_rows = [
-            tr
-            for tr in athlete_laps_table.find_all("tr")
-            if "lap" in tr.get_text(separator=" ", strip=True).lower()
-            and Utils.extract_time(tr.get_text()) is not None
-        ]
-
-        laps = cls.__parse_athlete_lap_rows(lap_rows)
-
-        athlete = Athlete(
-            name=athlete_name,
-            gender=athlete_gender,
-            city=athlete_city,
-            state=athlete_state,
-            country=athlete_country,
-        )
-        athlete = AthleteRegistry.get_or_register(athlete)
-
-        return Performance(
-            athlete=athlete,
-            laps=laps,
-            event=event,
-            category=performance_category,
-            age_group=performance_age_group,
-        )
-
-    @classmethod
-    def __parse_athlete_lap_rows(cls, lap_rows) -> list[LapStats]:
-        """
-        Parse the lap rows of an athlete's performance table and extract lap times.
-        """
-        laps = []
-        for lap_index, lap_row in enumerate(lap_rows):
-            lap_row_cols = lap_row.find_all("td")
-            lap_time = lap_row_cols[2]
-            extracted_time = str(Utils.extract_time(lap_time.text))
-            lap_time = Utils.convert_time_str_to_seconds(extracted_time)
-            if lap_time is None:
-                print(
-                    f"Could not convert lap time for lap {lap_index + 1}: {extracted_time}"
-                )
-                continue
-            lap_stats = LapStats(lap_number=lap_index + 1, lap_time_ss=lap_time)
-            laps.append(lap_stats)
-            # print(f"{lap_stats}")
-        return laps
+        return JmsParser.athlete_record(html, athlete_url)
 
     @classmethod
     def __fetch_all_athlete_performance_urls(
@@ -381,7 +339,8 @@ class EventScraper:
             )
             return []
 
-        ranking_home_soup = Webscraper.fetch_html(ranking_url)
+        immutable = HttpCache.is_settled(event_params.date)
+        ranking_home_soup = Webscraper.fetch_html(ranking_url, immutable)
 
         # Extract the number of pages from the ranking page
         number_of_pages = cls.__get_number_of_pages(ranking_home_soup)
@@ -403,13 +362,54 @@ class EventScraper:
                 base_url=ranking_url,
             )
             for ranking_page_url in ranking_pages_urls:
-                all_ranking_pages.append(Webscraper.fetch_html(ranking_page_url))
+                all_ranking_pages.append(
+                    Webscraper.fetch_html(ranking_page_url, immutable)
+                )
 
         # Parse all the athlete individual performances urls across the rows
         return cls.__parse_athlete_urls_from_ranking(
             all_ranking_pages_soup=all_ranking_pages, event_params=event_params
         )
 
+    @classmethod
+    async def __fetch_all_athlete_performance_urls_async(
+        cls, ranking_url: str, event_params: EventParams
+    ) -> list[str]:
+        """
+        Async version of __fetch_all_athlete_performance_urls, fetching the
+        ranking pages after the first one concurrently.
+        """
+        if not isinstance(event_params.scraped_site_params, JmsSiteParams):
+            print(
+                "EventScraper: Unsupported scraped site params for fetching athlete URLs."
+            )
+            return []
+
+        print(f"Fetching athlete performance URLs from: {ranking_url}")
+        immutable = HttpCache.is_settled(event_params.date)
+        ranking_home_soup = await Webscraper.fetch_html_async(ranking_url, immutable)
+        number_of_pages = cls.__get_number_of_pages(ranking_home_soup)
+
+        print(
+            f"Number of pages of {event_params.track.name} {event_params.date.year} : {number_of_pages}"
+        )
+
+        if number_of_pages == 1:
+            all_ranking_pages = [ranking_home_soup]
+        else:
+            all_ranking_pages = await asyncio.gather(
+                *(
+                    Webscraper.fetch_html_async(ranking_page_url, immutable)
+                    for ranking_page_url in cls.__build_all_ranking_pages_urls(
+                        number_of_pages=number_of_pages, base_url=ranking_url
+                    )
+                )
+            )
+
+        return cls.__parse_athlete_urls_from_ranking(
+            all_ranking_pages_soup=list(all_ranking_pages), event_params=event_params
+        )
+
     @classmethod
     def __parse_athlete_urls_from_ranking(
         cls, all_ranking_pages_soup: list[BeautifulSoup], event_params: EventParams
@@ -0,0 +1,112 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+class HttpCache:
+    """
+    Content-addressed on-disk cache of fetched pages and JSON documents.
+
+    Each entry is stored gzipped under the SHA-256 of its URL (and optional
+    request params), preceded by a one-line JSON header. Entries marked
+    immutable (results of events that are over) never expire, the others
+    expire after ``ttl`` seconds.
+    """
+
+    directory: Path = Path("scraper_cache")
+    enabled: bool = True
+    # Serve from the cache only: a miss is not fetched (offline parsing work)
+    offline: bool = False
+    # Lifetime of the entries that are not immutable (seconds)
+    ttl: float = 24 * 3600
+    # Results of events older than this are considered final
+    settle_days: int = 30
+    compresslevel: int = 6
+
+    @classmethod
+    def key(cls, url: str, params: dict | None = None) -> str:
+        """SHA-256 hex digest of a URL and its (order-independent) params."""
+        digest = hashlib.sha256(url.encode("utf-8"))
+        if params:
+            digest.update(b"\0")
+            digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def path_for(cls, key: str) -> Path:
+        return cls.directory / key[:2] / f"{key}.gz"
+
+    @classmethod
+    def get(cls, url: str, params: dict | None = None) -> bytes | None:
+        """
+        Return the cached body of a URL, or None if missing or expired.
+
+        Args:
+            url (str): Requested URL
+            params (dict | None): Request params, part of the key
+        Returns:
+            bytes | None: The cached body
+        """
+        if not cls.enabled:
+            return None
+        path = cls.path_for(cls.key(url, params))
+        try:
+            with gzip.open(path, "rb") as file:
+                header = json.loads(file.readline())
+                if not header.get("immutable") and (
+                    time.time() - header.get("fetched_at", 0) > cls.ttl
+                ):
+                    return None
+                return file.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError):
+            print(f"Ignoring corrupt cache entry: {path}")
+            return None
+
+    @classmethod
+    def put(
+        cls,
+        url: str,
+        body: bytes,
+        params: dict | None = None,
+        immutable: bool = False,
+    ) -> None:
+        """
+        Store the body of a URL.
+
+        Args:
+            url (str): Requested URL
+            body (bytes): Response body
+            params (dict | None): Request params, part of the key
+            immutable (bool): Whether the entry never expires
+        """
+        if not cls.enabled:
+            return
+        path = cls.path_for(cls.key(url, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            "url": url,
+            "params": params,
+            "fetched_at": time.time(),
+            "immutable": immutable,
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp_path, "wb", compresslevel=cls.compresslevel) as file:
+            file.write(json.dumps(header).encode("utf-8") + b"\n")
+            file.write(body)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def is_settled(cls, event_date: datetime) -> bool:
+        """Whether the results of an event on this date can be cached as immutable."""
+        return event_date < datetime.now() - timedelta(days=cls.settle_days)
+
+    @classmethod
+    def clear(cls) -> None:
+        shutil.rmtree(cls.directory, ignore_errors=True)
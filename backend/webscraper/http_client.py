@@ -0,0 +1,143 @@
+import asyncio
+import json
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from webscraper.http_cache import HttpCache
+
+
+class HttpClient:
+    """
+    Shared pooled HTTP client for the JSON endpoints of the scraped sites.
+
+    Blocking ``requests`` calls go through a single Session (keep-alive
+    connections, one pool per host). The async methods run them in worker
+    threads, with a minimum delay between two requests to the same host and
+    retries with exponential backoff; callers bound the requests in flight
+    (e.g. the fetchers of ScrapePipeline). Successful responses are stored in
+    (and served from) the HttpCache.
+    """
+
+    # Default number of requests in flight (pipeline fetchers, pool size)
+    concurrency: int = 8
+    # Minimum delay between the start of two requests to the same host (seconds)
+    min_host_interval: float = 0.1
+    # Attempts per request, and base delay doubled after each failed attempt
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    timeout: float = 30.0
+    # Status codes worth retrying (rate limited or transient server errors)
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    _session: requests.Session | None = None
+    _host_next_slot: dict[str, float] = {}
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=cls.concurrency, pool_maxsize=cls.concurrency
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+        return cls._session
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._session is not None:
+            cls._session.close()
+        cls._session = None
+        cls._host_next_slot.clear()
+
+    @classmethod
+    def get_json(cls, url: str, immutable: bool = False) -> Any | None:
+        """
+        Fetch and decode a JSON document, blocking.
+
+        Args:
+            url (str): URL of the JSON document
+            immutable (bool): Whether the document never changes (cached forever)
+        Returns:
+            Any | None: Decoded JSON, or None if the request failed
+        """
+        return asyncio.run(cls.fetch_json(url, immutable=immutable))
+
+    @classmethod
+    async def fetch_json(cls, url: str, immutable: bool = False) -> Any | None:
+        """
+        Fetch and decode a JSON document, retrying transient failures.
+
+        Args:
+            url (str): URL of the JSON document
+            immutable (bool): Whether the document never changes (cached forever)
+        Returns:
+            Any | None: Decoded JSON, or None if every attempt failed
+        """
+        cached = HttpCache.get(url)
+        if cached is not None:
+            return json.loads(cached)
+        if HttpCache.offline:
+            print(f"Not in cache (offline): {url}")
+            return None
+
+        host = urlsplit(url).netloc
+        session = cls.session()
+        for attempt in range(cls.max_attempts):
+            delay = cls.backoff_base * 2**attempt
+            try:
+                response = await cls._get(session, host, url)
+            except requests.RequestException as error:
+                print(f"Request failed ({error.__class__.__name__}): {url}")
+            else:
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                    except ValueError:
+                        print(f"Invalid JSON received from: {url}")
+                        return None
+                    HttpCache.put(url, response.content, immutable=immutable)
+                    return data
+                if response.status_code not in cls.retry_statuses:
+                    print(
+                        f"Failed to fetch JSON data. Status code: {response.status_code} ({url})"
+                    )
+                    return None
+                delay = max(delay, cls._retry_after(response))
+                print(f"Status code {response.status_code}, retrying: {url}")
+            if attempt + 1 < cls.max_attempts:
+                await asyncio.sleep(delay)
+        print(f"Giving up after {cls.max_attempts} attempts: {url}")
+        return None
+
+    @classmethod
+    async def _get(
+        cls, session: requests.Session, host: str, url: str
+    ) -> requests.Response:
+        await cls._wait_for_host(host)
+        return await asyncio.to_thread(session.get, url, timeout=cls.timeout)
+
+    @classmethod
+    async def _wait_for_host(cls, host: str) -> None:
+        """Wait until ``min_host_interval`` has passed since the last request to host."""
+        # Reserve the next slot of the host before awaiting (no await in between,
+        # so concurrent tasks always get distinct slots)
+        now = time.monotonic()
+        slot = max(now, cls._host_next_slot.get(host, 0.0))
+        cls._host_next_slot[host] = slot + cls.min_host_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    @classmethod
+    def _retry_after(cls, response: requests.Response) -> float:
+        """Delay requested by a Retry-After header given in seconds, else 0."""
+        try:
+            return float(response.headers.get("Retry-After", 0))
+        except ValueError:
+            return 0.0
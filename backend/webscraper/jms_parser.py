@@ -0,0 +1,118 @@
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+from models.athlete import Athlete
+from webscraper.performance_record import PerformanceRecord
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # Optional dependency: fall back to the stdlib parser
+    lxml = None
+
+
+class JmsParser:
+    """
+    Parser of JMS athlete pages into performance records.
+
+    Only the athlete info and lap split divs are parsed: the markup before the
+    first of them (navigation, ASP.NET view state...) is not even tokenized and
+    the rest is skipped by a SoupStrainer. lxml is used when it is installed,
+    and lap times are extracted with a single precompiled regex per row.
+    """
+
+    PARSER = "lxml" if lxml is not None else "html.parser"
+
+    INFO_DIV_ID = "ctl00_Content_Main_divLeft"
+    SPLIT_GRID_DIV_ID = "ctl00_Content_Main_divSplitGrid"
+    _ATHLETE_PAGE_STRAINER = SoupStrainer(
+        "div", id=[INFO_DIV_ID, SPLIT_GRID_DIV_ID]
+    )
+    _FIRST_DIV = re.compile(
+        rf"<div\b[^>]*\bid=[\"']?(?:{INFO_DIV_ID}|{SPLIT_GRID_DIV_ID})\b", re.I
+    )
+    # First HH:MM:SS time of a text, as in Utils.extract_time
+    _TIME = re.compile(r"(\d{2}):(\d{2}):(\d{2})")
+
+    @classmethod
+    def athlete_record(cls, html: str, athlete_url: str) -> dict | None:
+        """
+        Parse the athlete info and lap times of a JMS athlete page.
+
+        Args:
+            html (str): HTML of the athlete performance page
+            athlete_url (str): URL of the page (for messages)
+        Returns:
+            dict | None: Performance record, or None if the athlete has no laps
+        Raises:
+            ValueError: If the page is not an athlete page (error or challenge
+                page), so that it is fetched again rather than journaled
+        """
+        first_div = cls._FIRST_DIV.search(html)
+        if first_div:
+            html = html[first_div.start() :]
+        soup = BeautifulSoup(html, cls.PARSER, parse_only=cls._ATHLETE_PAGE_STRAINER)
+        athlete_info = soup.find(name="div", id=cls.INFO_DIV_ID)
+        if not athlete_info:
+            raise ValueError(f"Could not find athlete info on page: {athlete_url}")
+
+        athlete_name_span = athlete_info.find(
+            name="span", id="ctl00_Content_Main_lblName"
+        )
+        performance_category_span = athlete_info.find(
+            name="span", id="ctl00_Content_Main_lblEvent"
+        )
+        if not athlete_name_span or not performance_category_span:
+            raise ValueError(f"Could not find athlete name on page: {athlete_url}")
+        athlete_name = athlete_name_span.get_text().strip()
+        performance_category = performance_category_span.get_text().strip()
+
+        athlete_fields = {"gender": "", "city": "", "state": "", "country": ""}
+        for row in athlete_info.find_all("tr"):
+            row_tds = row.find_all("td")
+            if len(row_tds) < 2:
+                continue
+            label = row_tds[0].get_text().strip().lower()
+            value = row_tds[1].get_text().strip()
+            for field in athlete_fields:
+                if field in label:
+                    athlete_fields[field] = value
+                    break
+            else:
+                if "category" in label and label != "secondary category :":
+                    performance_category = value
+
+        athlete_laps_table = soup.find(name="div", id=cls.SPLIT_GRID_DIV_ID)
+        if not athlete_laps_table:
+            print(f"No laps table found for athlete: {athlete_name} at {athlete_url}")
+            return None
+
+        return PerformanceRecord.create(
+            athlete=Athlete(name=athlete_name, **athlete_fields),
+            category=performance_category,
+            age_group="",
+            lap_times=cls.lap_times(athlete_laps_table),
+        )
+
+    @classmethod
+    def lap_times(cls, athlete_laps_table: Tag) -> list[int]:
+        """
+        Extract the lap times (seconds) of the lap rows of a split grid: the rows
+        mentioning "lap" and holding a time, whose time is in the third column.
+        """
+        lap_times: list[int] = []
+        lap_number = 0
+        for row in athlete_laps_table.find_all("tr"):
+            row_text = row.get_text(" ")
+            if "lap" not in row_text.lower() or not cls._TIME.search(row_text):
+                continue
+            lap_number += 1
+            row_tds = row.find_all("td", limit=3)
+            match = cls._TIME.search(row_tds[2].get_text()) if len(row_tds) > 2 else None
+            if match is None:
+                print(f"Could not convert lap time for lap {lap_number}")
+                continue
+            hours, minutes, seconds = match.groups()
+            lap_times.append(int(hours) * 3600 + int(minutes) * 60 + int(seconds))
+        return lap_times
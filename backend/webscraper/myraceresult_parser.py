@@ -0,0 +1,93 @@
+from models.athlete import Athlete
+from utils import Utils
+from webscraper.myraceresult_params import MyRaceResultParams
+from webscraper.performance_record import PerformanceRecord
+
+
+class MyRaceResultParser:
+    """
+    Parser of MyRaceResult participants and lap details JSON into performance records.
+    """
+
+    @classmethod
+    def participants_rows(cls, participants_json: dict) -> list[list[str]] | None:
+        """
+        Find the list of participant rows in the participants JSON data.
+        """
+        for key in [1, 2]:
+            try:
+                return participants_json["data"][f"#{key}_Individual"]
+            except (KeyError, TypeError):
+                continue
+        return None
+
+    @classmethod
+    def format_name(cls, name: str) -> str:
+        """
+        Format a MyRaceResult participant name to "Last, First" format to "First Last"
+        Args:
+            name (str): Name string from MyRaceResult participant data
+        Returns:
+            str: Formatted name string
+        """
+        name_parts = name.split(", ")
+        if len(name_parts) == 2:
+            formatted_name = f"{name_parts[1]} {name_parts[0]}"
+            return formatted_name
+        return name
+
+    @classmethod
+    def participant_record(
+        cls,
+        laps_json: dict,
+        participant: list[str],
+        site_params: MyRaceResultParams,
+    ) -> dict | None:
+        """
+        Parse the performance record of a MyRaceResult participant from its lap details JSON.
+
+        Args:
+            laps_json (dict): Lap details JSON data of the participant
+            participant (list[str]): Row of the participant in the participants list
+            site_params (MyRaceResultParams): Column indexes of the participants list
+        Returns:
+            dict | None: The performance record, or None if it has no laps
+        """
+        participant_name: str = cls.format_name(participant[3])
+        participant_age_category: str = participant[site_params.age_group_col_index]
+        participant_discipline: str = participant[site_params.category_col_index]
+        participant_gender: str = participant[site_params.gender_col_index]
+        if participant_gender == "Open":
+            participant_gender = "Male"
+
+        laps_data = laps_json.get("data") or []
+        lap_times: list[int] = []
+        for lap_index, lap_data in enumerate(laps_data):
+            lap_time = lap_data[4][:-3]
+            if len(lap_time) == 5:
+                lap_time_formatted = "00:" + str(lap_time)
+            elif len(lap_time) == 7:
+                lap_time_formatted = "0" + str(lap_time)
+            else:
+                lap_time_formatted = str(lap_time)
+
+            lap_time_seconds = Utils.convert_time_str_to_seconds(lap_time_formatted)
+            if lap_time_seconds is None:
+                print(
+                    f"Could not convert lap time for lap {lap_index + 1}: {lap_time_formatted}"
+                )
+                continue
+            lap_times.append(lap_time_seconds)
+
+        # If there are no lap values, skip this participant
+        if not lap_times:
+            print(f"No laps found for participant {participant_name}")
+            return None
+
+        return PerformanceRecord.create(
+            athlete=Athlete(name=participant_name, gender=participant_gender),
+            category=participant_discipline,
+            age_group=participant_age_category,
+            lap_times=lap_times,
+        )
+        # https://my4.raceresult.com/192607/RRPublish/data/list?key=9d484a9a9259ff0ae1a4a8570861bc3b&listname=Online%7CLap%20Details&page=live&contest=0&r=pid&pid=421
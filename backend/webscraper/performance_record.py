@@ -0,0 +1,55 @@
+from array import array
+
+from models.athlete import Athlete
+from models.athlete_registry import AthleteRegistry
+from models.event import Event
+from models.performance import Performance
+
+
+class PerformanceRecord:
+    """
+    Plain (JSON-serializable, picklable) record of a scraped performance,
+    produced by the parsers before its athlete is registered.
+    """
+
+    @classmethod
+    def create(
+        cls, athlete: Athlete, category: str, age_group: str, lap_times: list[int]
+    ) -> dict:
+        """
+        Build a performance record.
+
+        Args:
+            athlete (Athlete): The athlete, not registered
+            category (str): Category of the performance
+            age_group (str): Age group of the performance
+            lap_times (list[int]): Lap times in seconds
+        Returns:
+            dict: The record
+        """
+        return {
+            "athlete": athlete.to_dict(),
+            "category": category,
+            "age_group": age_group,
+            "lap_times": lap_times,
+        }
+
+    @classmethod
+    def to_performance(cls, record: dict, event: Event) -> Performance:
+        """
+        Build the performance of a record, registering its athlete.
+
+        Args:
+            record (dict): The record
+            event (Event): Event the performance belongs to
+        Returns:
+            Performance: The performance
+        """
+        athlete = AthleteRegistry.get_or_register(Athlete.from_dict(record["athlete"]))
+        return Performance(
+            athlete=athlete,
+            laps=array("I", record["lap_times"]),
+            event=event,
+            category=record["category"],
+            age_group=record["age_group"],
+        )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from models.event import Event
+
+
+class ScrapeJournal:
+    """
+    Append-only checkpoint journal of the participants of an event already
+    scraped, so that an interrupted scrape resumes where it stopped.
+
+    Each line is ``{"key": ..., "record": ...}``: the key identifies the
+    participant as seen on the site (its page URL, or its id plus a digest of
+    its row so that a changed participant is fetched again) and the record is
+    the plain parsed data of its performance, or null when the participant
+    was parsed but has no performance (no laps).
+    """
+
+    directory: Path = Path("scrape_journal")
+
+    def __init__(self, event: Event) -> None:
+        """
+        Open the journal of an event, loading the records of a previous run.
+
+        :param event: The event being scraped.
+        """
+        self.path: Path = self.path_for(event)
+        self.records: dict[str, dict | None] = {}
+        self._file: TextIO | None = None
+        # Whether the file ends with a line cut short, to be terminated first
+        self._cut_line: bool = False
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    self._cut_line = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Last line cut short by the interruption
+                        continue
+                    self.records[entry["key"]] = entry["record"]
+            if self.records:
+                print(f"Resuming from {len(self.records)} journaled participants")
+
+    @classmethod
+    def path_for(cls, event: Event) -> Path:
+        return cls.directory / f"{event.slug}.jsonl"
+
+    @classmethod
+    def discard(cls, event: Event) -> None:
+        """Remove the journal of an event, once its scrape is saved."""
+        cls.path_for(event).unlink(missing_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.records
+
+    def get(self, key: str) -> dict | None:
+        return self.records.get(key)
+
+    def record(self, key: str, record: dict | None) -> None:
+        """Journal a parsed participant, flushed right away."""
+        self.records[key] = record
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            if self._cut_line:
+                self._file.write("\n")
+        self._file.write(json.dumps({"key": key, "record": record}) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> ScrapeJournal:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
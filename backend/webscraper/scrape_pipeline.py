@@ -0,0 +1,161 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Awaitable, Callable
+
+from webscraper.scrape_journal import ScrapeJournal
+
+
+class ScrapePipeline:
+    """
+    Staged scraping pipeline:
+
+    1. ``fetchers`` async workers fetch the raw page or JSON of each item and
+       push it into a bounded queue.
+    2. A dispatcher sends the raw data to a process pool where it is parsed
+       into a plain performance record. At most ``queue_size`` items are
+       being parsed: beyond that the queue fills up and fetching pauses.
+    3. A single consumer receives the records in item order (whatever the
+       order they were fetched and parsed in) so that athlete registration
+       and ``Event.add_performance`` stay sequential and deterministic.
+
+    Items already in the journal skip stages 1 and 2, and every parsed
+    record (None included) is journaled as soon as it is parsed.
+    """
+
+    fetchers: int = 8
+    queue_size: int = 32
+    # Processes parsing the raw data (0: parse in the event loop)
+    parse_workers: int = min(4, os.cpu_count() or 1)
+
+    def __init__(
+        self,
+        fetch: Callable[[Any], Awaitable[Any | None]],
+        parse: Callable[[Any, Any], dict | None],
+        consume: Callable[[dict | None], None],
+        journal: ScrapeJournal,
+        fetchers: int | None = None,
+        parse_workers: int | None = None,
+    ) -> None:
+        """
+        Args:
+            fetch: Coroutine function fetching the raw data of an item (None on failure)
+            parse: Picklable function parsing ``(raw, item)`` into a record
+                (or None), run in the process pool. It raises for raw data that
+                must be fetched again: such items are not journaled
+            consume: Called with the record of each item, in item order
+            journal: Journal of the event
+            fetchers (int | None): Concurrent fetches (default: cls.fetchers)
+            parse_workers (int | None): Parsing processes (default: cls.parse_workers)
+        """
+        self.fetch = fetch
+        self.parse = parse
+        self.consume = consume
+        self.journal: ScrapeJournal = journal
+        self.fetchers: int = fetchers or type(self).fetchers
+        self.parse_workers: int = (
+            type(self).parse_workers if parse_workers is None else parse_workers
+        )
+
+    async def run(self, items: list[tuple[str, Any]]) -> None:
+        """
+        Run the pipeline over items, returning once every record is consumed.
+
+        Args:
+            items (list[tuple[str, Any]]): ``(journal key, item)`` pairs, in the
+                order their records must be consumed
+        Raises:
+            Exception: The first error of ``consume`` or of the journal, once
+                the other items are fetched and parsed
+        """
+        if self.parse_workers > 0:
+            with ProcessPoolExecutor(max_workers=self.parse_workers) as executor:
+                await self.__run(items, executor)
+        else:
+            await self.__run(items, None)
+
+    async def __run(
+        self, items: list[tuple[str, Any]], executor: Executor | None
+    ) -> None:
+        pending: asyncio.Queue[tuple[int, str, Any]] = asyncio.Queue()
+        fetched: asyncio.Queue[tuple[int, str, Any, Any] | None] = asyncio.Queue(
+            maxsize=self.queue_size
+        )
+        # Records waiting for the records of the items before them
+        ready: dict[int, dict | None] = {}
+        next_index = 0
+
+        def deliver(index: int, record: dict | None) -> None:
+            nonlocal next_index
+            ready[index] = record
+            while next_index in ready:
+                self.consume(ready.pop(next_index))
+                next_index += 1
+
+        for index, (key, item) in enumerate(items):
+            if key in self.journal:
+                deliver(index, self.journal.get(key))
+            else:
+                pending.put_nowait((index, key, item))
+        if next_index == len(items):
+            return
+
+        async def fetch_worker() -> None:
+            while not pending.empty():
+                index, key, item = pending.get_nowait()
+                try:
+                    raw = await self.fetch(item)
+                except Exception as error:
+                    print(f"Fetching {key} failed: {error!r}")
+                    raw = None
+                await fetched.put((index, key, item, raw))
+
+        async def parse_task(index: int, key: str, item: Any, raw: Any) -> None:
+            if raw is None:
+                deliver(index, None)
+                return
+            try:
+                if executor is None:
+                    record = self.parse(raw, item)
+                else:
+                    loop = asyncio.get_running_loop()
+                    record = await loop.run_in_executor(
+                        executor, self.parse, raw, item
+                    )
+            except Exception as error:
+                # Not journaled: fetched and parsed again by the next run
+                print(f"Parsing {key} failed: {error!r}")
+                deliver(index, None)
+                return
+            self.journal.record(key, record)
+            deliver(index, record)
+
+        async def dispatcher() -> None:
+            parsing = asyncio.Semaphore(self.queue_size)
+            # Every task is kept and awaited: an error of the consumer or of
+            # the journal (raised after parsing) must not be lost
+            parse_tasks: list[asyncio.Task] = []
+            while True:
+                await parsing.acquire()
+                entry = await fetched.get()
+                if entry is None:
+                    break
+                task = asyncio.create_task(parse_task(*entry))
+                parse_tasks.append(task)
+                task.add_done_callback(lambda _: parsing.release())
+            await asyncio.gather(*parse_tasks)
+
+        async def fetch_all() -> None:
+            await asyncio.gather(
+                *(fetch_worker() for _ in range(min(self.fetchers, pending.qsize())))
+            )
+            await fetched.put(None)
+
+        # The dispatcher keeps draining the queue after an error, so the
+        # fetchers never wait on a full queue, and the error is raised once
+        # every item went through (the records parsed since are journaled)
+        await asyncio.gather(fetch_all(), dispatcher())
+        if next_index != len(items):
+            raise RuntimeError(
+                f"Only {next_index} of {len(items)} records were consumed"
+            )
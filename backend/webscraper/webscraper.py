@@ -1,5 +1,8 @@
+import re
+
 from bs4 import BeautifulSoup
 from webscraper.browser_manager import BrowserManager
+from webscraper.http_cache import HttpCache
 
 
 class Webscraper:
@@ -7,23 +10,140 @@ class Webscraper:
     A class that provides methods for web scraping and extracting information from web pages.
     """
 
+    # "request": plain HTTP request sent from the browser context (shares its
+    # cookies, nothing rendered), falling back to a page navigation when it is
+    # blocked (Cloudflare challenge, error status). "navigate": always render.
+    fetch_mode: str = "request"
+
+    _CLOUDFLARE_TITLE = re.compile(r"<title>\s*Just a moment\.\.\.\s*</title>", re.I)
+
     @classmethod
-    def fetch_html(cls, url: str) -> BeautifulSoup:
+    def fetch_html(cls, url: str, immutable: bool = False) -> BeautifulSoup:
         """
         Fetches the HTML content from the specified URL.
 
         :param url: The URL to fetch the HTML content from.
+        :param immutable: Whether the page never changes (cached forever).
+        :return: The BeautifulSoup object representing the parsed HTML content.
+        """
+        return cls.parse_html(cls.fetch_text(url, immutable))
+
+    @classmethod
+    async def fetch_html_async(cls, url: str, immutable: bool = False) -> BeautifulSoup:
+        """
+        Fetches the HTML content from the specified URL with a page of the async pool.
+
+        :param url: The URL to fetch the HTML content from.
+        :param immutable: Whether the page never changes (cached forever).
+        :return: The BeautifulSoup object representing the parsed HTML content.
+        """
+        return cls.parse_html(await cls.fetch_text_async(url, immutable))
+
+    @classmethod
+    def fetch_text(cls, url: str, immutable: bool = False) -> str:
+        """
+        Fetches the raw HTML of the specified URL (served from the HttpCache when present).
+
+        :param url: The URL to fetch the HTML content from.
+        :param immutable: Whether the page never changes (cached forever).
+        :return: The HTML content (empty on an offline cache miss).
+        """
+        cached = cls.__cached_text(url)
+        if cached is not None:
+            return cached
+
+        if cls.fetch_mode == "request":
+            response = BrowserManager.request_context().get(url, timeout=60_000)
+            html = response.text()
+            if cls.__is_unblocked(url, response.status, html):
+                HttpCache.put(url, html.encode("utf-8"), immutable=immutable)
+                return html
+
+        with BrowserManager.page() as page:
+            navigation = page.goto(url, timeout=60_000, wait_until="domcontentloaded")
+            page.wait_for_load_state("domcontentloaded")
+            html = page.content()
+        ok = navigation is not None and navigation.ok
+        cls.__cache_navigated(url, html, immutable, ok)
+        return html
+
+    @classmethod
+    async def fetch_text_async(cls, url: str, immutable: bool = False) -> str:
+        """
+        Fetches the raw HTML of the specified URL with a page of the async pool
+        (served from the HttpCache when present).
+
+        :param url: The URL to fetch the HTML content from.
+        :param immutable: Whether the page never changes (cached forever).
+        :return: The HTML content (empty on an offline cache miss).
+        """
+        cached = cls.__cached_text(url)
+        if cached is not None:
+            return cached
+
+        if cls.fetch_mode == "request":
+            async with BrowserManager.async_request() as request:
+                response = await request.get(url, timeout=60_000)
+                html = await response.text()
+            if cls.__is_unblocked(url, response.status, html):
+                HttpCache.put(url, html.encode("utf-8"), immutable=immutable)
+                return html
+
+        async with BrowserManager.async_page() as page:
+            navigation = await page.goto(
+                url, timeout=60_000, wait_until="domcontentloaded"
+            )
+            await page.wait_for_load_state("domcontentloaded")
+            html = await page.content()
+        ok = navigation is not None and navigation.ok
+        cls.__cache_navigated(url, html, immutable, ok)
+        return html
+
+    @classmethod
+    def parse_html(cls, html: str) -> BeautifulSoup:
+        """
+        Parses fetched HTML content.
+
+        :param html: The HTML content.
         :return: The BeautifulSoup object representing the parsed HTML content.
         """
-        page = BrowserManager.new_page()
-        page.goto(url, timeout=60_000, wait_until="domcontentloaded")
-        page.wait_for_load_state("domcontentloaded")
-        html = page.content()
-        page.close()
+        return BeautifulSoup(html, "html.parser")
 
-        soup = BeautifulSoup(html, "html.parser")
+    @classmethod
+    def is_cloudflare_challenge(cls, html: str) -> bool:
+        return cls._CLOUDFLARE_TITLE.search(html) is not None
+
+    @classmethod
+    def __cached_text(cls, url: str) -> str | None:
+        """
+        Returns the cached HTML of a URL. In offline mode a miss gives an empty
+        page, otherwise None (the page must be fetched).
+        """
+        cached = HttpCache.get(url)
+        if cached is not None:
+            return cached.decode("utf-8")
+        if HttpCache.offline:
+            print(f"Not in cache (offline): {url}")
+            return ""
+        return None
 
-        title_tag = soup.title
-        if title_tag and title_tag.get_text(strip=True) == "Just a moment...":
+    @classmethod
+    def __cache_navigated(cls, url: str, html: str, immutable: bool, ok: bool) -> None:
+        # Challenge and error pages are not cached, so that they are fetched again
+        if cls.is_cloudflare_challenge(html):
             print("Encountered Cloudflare protection page : page not scraped.")
-        return soup
+        elif not ok:
+            print(f"Navigation failed (error status), page not cached: {url}")
+        else:
+            HttpCache.put(url, html.encode("utf-8"), immutable=immutable)
+
+    @classmethod
+    def __is_unblocked(cls, url: str, status: int, html: str) -> bool:
+        """
+        Whether a direct request got the page, rather than being blocked (the
+        page must then be navigated to instead).
+        """
+        if status == 200 and not cls.is_cloudflare_challenge(html):
+            return True
+        print(f"Direct request blocked (status {status}), navigating to: {url}")
+        return False
@@ -16,7 +16,8 @@ export const fetchEventByNameYear = async (name: string, year: string) => {
     return response.json()
 }
 
-export const fetchEventGraphData = async (name: string, year: string) => {
-    const response = await fetch(`${API_URL}${EVENTS_ENDPOINT}/${name}/${year}/graph`)
+export const fetchEventGraphData = async (name: string, year: string, maxPoints?: number) => {
+    const query = maxPoints ? `?max_points=${maxPoints}` : ''
+    const response = await fetch(`${API_URL}${EVENTS_ENDPOINT}/${name}/${year}/graph${query}`)
     return response.json()
 }